@@ -43,13 +43,27 @@ DEFAULT_VARIABLES = [
     'Albedo_Unitless', 'DataVersion'
 ]
 
+# Subset of VARIABLE_MAP with the names used by the SolarAnywhere API, which
+# unlike the names used in files include the unit after an underscore
+_API_VARIABLE_MAP = {k: v for k, v in VARIABLE_MAP.items() if '_' in k}
+
+
+def _minimal_variables_for(pvlib_names):
+    """Return the API variables needed to retrieve the given pvlib names."""
+    unknown = set(pvlib_names) - set(_API_VARIABLE_MAP.values())
+    if unknown:
+        raise ValueError(f'Unknown `request_fields`: {sorted(unknown)}')
+    return ['ObservationTime'] + [
+        k for k, v in _API_VARIABLE_MAP.items() if v in pvlib_names]
+
 
 def get_solaranywhere(latitude, longitude, api_key, start=None, end=None,
                       source='SolarAnywhereLatest', time_resolution=60,
                       spatial_resolution=0.01, true_dynamics=False,
                       probability_of_exceedance=None,
                       variables=DEFAULT_VARIABLES, missing_data='FillAverage',
-                      url=URL, map_variables=True, timeout=300):
+                      url=URL, map_variables=True, timeout=300,
+                      request_fields=None, session=None):
     """Retrieve historical irradiance time series data from SolarAnywhere.
 
     The SolarAnywhere API is described in [1]_ and [2]_. A detailed list of
@@ -99,6 +113,15 @@ def get_solaranywhere(latitude, longitude, api_key, start=None, end=None,
         where applicable. See :const:`VARIABLE_MAP`.
     timeout: float, default: 300
         Time in seconds to wait for requested data to become available.
+    request_fields: list-like, optional
+        pvlib variable names to retrieve, e.g. ``['ghi', 'dni', 'dhi']``.
+        If specified, only 'ObservationTime' and the corresponding API
+        variables are requested, which reduces the size of the response, and
+        ``variables`` is ignored. See :const:`VARIABLE_MAP`.
+    session: requests.Session, optional
+        Session used to send the API requests, e.g., a
+        ``requests_cache.CachedSession`` to cache responses locally. If not
+        specified, each request is sent with :py:mod:`requests` directly.
 
     Returns
     -------
@@ -139,6 +162,9 @@ def get_solaranywhere(latitude, longitude, api_key, start=None, end=None,
                'X-Api-Key': api_key,
                'Accept': "application/json"}
 
+    if request_fields is not None:
+        variables = _minimal_variables_for(request_fields)
+
     payload = {
         "Sites": [{
             "Latitude": latitude,
@@ -178,8 +204,10 @@ def get_solaranywhere(latitude, longitude, api_key, start=None, end=None,
 
     # Convert the payload dictionary to a JSON string (uses double quotes)
     payload = json.dumps(payload)
+    if session is None:
+        session = requests
     # Make data request
-    request = requests.post(url+'/WeatherData', data=payload, headers=headers)
+    request = session.post(url+'/WeatherData', data=payload, headers=headers)
     # Raise error if request is not OK
     if request.ok is False:
         raise ValueError(request.json()['Message'])
@@ -191,7 +219,7 @@ def get_solaranywhere(latitude, longitude, api_key, start=None, end=None,
     start_time = time.time()  # Current time in seconds since the Epoch
     # Attempt to retrieve results until the max response time has been exceeded
     while True:
-        results = requests.get(url+'/WeatherDataResult/'+weather_request_id, headers=headers)  # noqa: E501
+        results = session.get(url+'/WeatherDataResult/'+weather_request_id, headers=headers)  # noqa: E501
         results_json = results.json()
         if results_json.get('Status') == 'Done':
             if results_json['WeatherDataResults'][0]['Status'] == 'Failure':
@@ -203,8 +231,14 @@ def get_solaranywhere(latitude, longitude, api_key, start=None, end=None,
 
     # Extract time series data
     data = pd.DataFrame(results_json['WeatherDataResults'][0]['WeatherDataPeriods']['WeatherDataPeriods'])  # noqa: E501
-    # Set datetime index
-    data.index = pd.to_datetime(data['ObservationTime'])
+    # Set datetime index. Parsing the timestamps as UTC is considerably faster
+    # than parsing the offsets, so convert back to the returned offset after.
+    if len(data) > 0:
+        tz = pd.Timestamp(data['ObservationTime'].iloc[0]).tz
+        data.index = pd.DatetimeIndex(
+            pd.to_datetime(data['ObservationTime'], utc=True)).tz_convert(tz)
+    else:
+        data.index = pd.DatetimeIndex([], name='ObservationTime')
     if map_variables:
         data = data.rename(columns=VARIABLE_MAP)
 
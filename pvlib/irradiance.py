@@ -6,7 +6,7 @@ irradiance, and total irradiance under various conditions.
 
 import datetime
 from collections import OrderedDict
-from functools import partial
+from functools import lru_cache, partial
 
 import numpy as np
 import pandas as pd
@@ -3271,10 +3271,13 @@ def _get_perez_coefficients(perezmodel):
     return F1coeffs, F2coeffs
 
 
+@lru_cache(maxsize=1)
 def _get_dirint_coeffs():
     """
     A place to stash the dirint coefficients.
 
+    The array is built on the first call and cached; it is read-only.
+
     Returns
     -------
     np.array with shape ``(6, 6, 7, 5)``.
@@ -3611,7 +3614,9 @@ def _get_dirint_coeffs():
         [0.475230, 0.500000, 0.518640, 0.339970, 0.520230],
         [0.743440, 0.592190, 0.603060, 0.316930, 0.794390]]
 
-    return coeffs[1:, 1:, :, :]
+    coeffs = coeffs[1:, 1:, :, :]
+    coeffs.flags.writeable = False
+    return coeffs
 
 
 def dni(ghi, dhi, zenith, clearsky_dni=None, clearsky_tolerance=1.1,
@@ -404,18 +404,13 @@ def _cocontent(v, c, isc, kflag):
 def _cocontent_regress(v, i, voc, isc, cci):
     # Used by fit_sandia_content
     # For the method coded here see Appendix C of [2] SAND2015-2065
-    # predictor variables for regression of CC
-    x = np.vstack((v, isc - i, v * (isc - i), v * v, (i - isc) ** 2)).T
-
     # define principal components transformation to shift, scale and rotate
     # V and I before the regression.
-    tmpx = x[:, 0:2]
-    tmpx_length = tmpx.shape[0]
+    tmpx = np.column_stack((v, isc - i))
 
     tmpx_mean = np.mean(tmpx, axis=0)
     tmpx_std = np.std(tmpx, axis=0, ddof=1)
-    tmpx_zscore = (tmpx - np.tile(tmpx_mean, [tmpx_length, 1])) / \
-        np.tile(tmpx_std, [tmpx_length, 1])
+    tmpx_zscore = (tmpx - tmpx_mean) / tmpx_std
 
     tmpx_d, tmpx_v = np.linalg.eig(np.cov(tmpx_zscore.T))
 
@@ -435,8 +430,8 @@ def _cocontent_regress(v, i, voc, isc, cci):
 
     # predictors. Shifting makes a constant term necessary in the regression
     # model
-    sx = np.vstack((s[:, 0], s[:, 1], s[:, 0] * s[:, 1], s[:, 0] * s[:, 0],
-                    s[:, 1] * s[:, 1], col1)).T
+    sx = np.column_stack((s[:, 0], s[:, 1], s[:, 0] * s[:, 1],
+                          s[:, 0] * s[:, 0], s[:, 1] * s[:, 1], col1))
 
     gamma = np.linalg.lstsq(sx, scc, rcond=None)[0]
     # coefficients from regression in rotated coordinates
@@ -454,16 +449,15 @@ def _cocontent_regress(v, i, voc, isc, cci):
                    [0., 0., r[0, 1] * r[1, 1], r[0, 1] ** 2., r[1, 1] ** 2.]])
 
     # matrix which is used to undo effect of shifting and scaling on regression
-    # coefficients.
-    ma = np.array([[np.std(v, ddof=1), 0., np.std(v, ddof=1) *
-                    np.mean(isc - i), 2. * np.std(v, ddof=1) * np.mean(v),
-                   0.], [0., np.std(isc - i, ddof=1), np.std(isc - i, ddof=1)
-                         * np.mean(v), 0.,
-                   2. * np.std(isc - i, ddof=1) * np.mean(isc - i)],
-                   [0., 0., np.std(v, ddof=1) * np.std(isc - i, ddof=1), 0.,
-                    0.],
-                   [0., 0., 0., np.std(v, ddof=1) ** 2., 0.],
-                   [0., 0., 0., 0., np.std(isc - i, ddof=1) ** 2.]])
+    # coefficients. The means and standard deviations of V and Isc - I are
+    # those used for the zscore above.
+    v_mean, di_mean = tmpx_mean
+    v_std, di_std = tmpx_std
+    ma = np.array([[v_std, 0., v_std * di_mean, 2. * v_std * v_mean, 0.],
+                   [0., di_std, di_std * v_mean, 0., 2. * di_std * di_mean],
+                   [0., 0., v_std * di_std, 0., 0.],
+                   [0., 0., 0., v_std ** 2., 0.],
+                   [0., 0., 0., 0., di_std ** 2.]])
 
     # translate from coefficients in rotated space (gamma) to coefficients in
     # original coordinates (beta)
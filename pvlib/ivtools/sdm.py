@@ -9,10 +9,11 @@ Function names should follow the pattern "fit_" + name of model + "_" +
 import numpy as np
 
 from scipy import constants
+from scipy import linalg
 from scipy import optimize
 from scipy.special import lambertw
 
-from pvlib.pvsystem import calcparams_pvsyst, singlediode, v_from_i
+from pvlib.pvsystem import calcparams_pvsyst
 from pvlib.singlediode import bishop88_mpp
 
 from pvlib.ivtools.utils import rectify_iv_curve, _numdiff
@@ -120,7 +121,7 @@ def fit_cec_sam(celltype, v_mp, i_mp, v_oc, i_sc, alpha_sc, beta_voc,
 
 def fit_desoto(v_mp, i_mp, v_oc, i_sc, alpha_sc, beta_voc, cells_in_series,
                EgRef=1.121, dEgdT=-0.0002677, temp_ref=25, irrad_ref=1000,
-               root_kwargs={}):
+               root_kwargs={}, x0=None):
     """
     Calculates the parameters for the De Soto single diode model.
 
@@ -129,7 +130,9 @@ def fit_desoto(v_mp, i_mp, v_oc, i_sc, alpha_sc, beta_voc, cells_in_series,
     datasheets of PV modules.
 
     The solution is found using the scipy.optimize.root() function,
-    with the corresponding default solver method 'hybr'.
+    with the corresponding default solver method 'hybr'. For the methods
+    'hybr' and 'lm' the analytic Jacobian of the system of equations is
+    used unless ``jac`` is given in ``root_kwargs``.
     No restriction is put on the fit variables, i.e. series
     or shunt resistance could go negative. Nevertheless, if it happens,
     check carefully the inputs and their units; alpha_sc and beta_voc are
@@ -168,6 +171,13 @@ def fit_desoto(v_mp, i_mp, v_oc, i_sc, alpha_sc, beta_voc, cells_in_series,
         Reference irradiance condition [W/m2]
     root_kwargs : dictionary, optional
         Dictionary of arguments to pass onto scipy.optimize.root()
+    x0 : dict or array-like, optional
+        Initial values for the solver. Either a dict with keys ``'I_L_ref'``,
+        ``'I_o_ref'``, ``'R_s'``, ``'R_sh_ref'`` and ``'a_ref'``, such as the
+        parameters returned by a previous call, or an array of those values
+        in that order. When fitting many similar modules, starting from the
+        parameters of a previous fit can reduce the number of iterations. If
+        not provided, initial values are estimated from the inputs.
 
     Returns
     -------
@@ -212,19 +222,29 @@ def fit_desoto(v_mp, i_mp, v_oc, i_sc, alpha_sc, beta_voc, cells_in_series,
     k = constants.value('Boltzmann constant in eV/K')  # in eV/K
     Tref = temp_ref + 273.15  # [K]
 
-    # initial guesses of variables for computing convergence:
-    # Values are taken from [2], p753
-    Rsh_0 = 100.0
-    a_0 = 1.5*k*Tref*cells_in_series
-    IL_0 = i_sc
-    Io_0 = i_sc * np.exp(-v_oc/a_0)
-    Rs_0 = (a_0*np.log1p((IL_0-i_mp)/Io_0) - v_mp)/i_mp
-    # params_i : initial values vector
-    params_i = np.array([IL_0, Io_0, Rs_0, Rsh_0, a_0])
+    if x0 is None:
+        # initial guesses of variables for computing convergence:
+        # Values are taken from [2], p753
+        Rsh_0 = 100.0
+        a_0 = 1.5*k*Tref*cells_in_series
+        IL_0 = i_sc
+        Io_0 = i_sc * np.exp(-v_oc/a_0)
+        Rs_0 = (a_0*np.log1p((IL_0-i_mp)/Io_0) - v_mp)/i_mp
+        # params_i : initial values vector
+        params_i = np.array([IL_0, Io_0, Rs_0, Rsh_0, a_0])
+    elif isinstance(x0, dict):
+        params_i = np.array([x0['I_L_ref'], x0['I_o_ref'], x0['R_s'],
+                             x0['R_sh_ref'], x0['a_ref']], dtype=float)
+    else:
+        params_i = np.asarray(x0, dtype=float)
 
     # specs of module
-    specs = (i_sc, v_oc, i_mp, v_mp, beta_voc, alpha_sc, EgRef, dEgdT,
-             Tref, k)
+    specs = _specs_desoto(i_sc, v_oc, i_mp, v_mp, beta_voc, alpha_sc, EgRef,
+                          dEgdT, Tref, k)
+
+    # the analytic Jacobian is only used by the 'hybr' and 'lm' methods
+    if root_kwargs.get('method', 'hybr') in ('hybr', 'lm'):
+        root_kwargs = {'jac': _jacobian_desoto, **root_kwargs}
 
     # computing with system of equations described in [1]
     optimize_result = optimize.root(_system_of_equations_desoto, x0=params_i,
@@ -250,6 +270,28 @@ def fit_desoto(v_mp, i_mp, v_oc, i_sc, alpha_sc, beta_voc, cells_in_series,
             optimize_result)
 
 
+def _specs_desoto(Isc, Voc, Imp, Vmp, beta_oc, alpha_sc, EgRef, dEgdT, Tref,
+                  k):
+    """Collects the inputs of the systems of equations used by fit_desoto.
+
+    The 5th equation is the open-circuit condition at T2 = Tref + 2; the
+    terms that do not depend on the model parameters are computed here
+    once rather than at each evaluation of the equations.
+
+    Returns
+    -------
+    tuple of Isc, Voc, Imp, Vmp, Voc2, dIL2, T2/Tref and Io2/Io, where
+    Voc2 is Voc at T2, dIL2 the increase of IL at T2, and Io2/Io the ratio
+    of Io at T2 to Io at Tref.
+    """
+    T2 = Tref + 2
+    Voc2 = (T2 - Tref) * beta_oc + Voc  # eq (7) in [1]
+    dIL2 = alpha_sc * (T2 - Tref)  # eq (11) in [1]
+    Eg2 = EgRef * (1 + dEgdT * (T2 - Tref))  # eq (10) in [1]
+    Io2_Io = (T2 / Tref)**3 * np.exp(1 / k * (EgRef/Tref - Eg2/T2))  # eq (9)
+    return (Isc, Voc, Imp, Vmp, Voc2, dIL2, T2 / Tref, Io2_Io)
+
+
 def _system_of_equations_desoto(params, specs):
     """Evaluates the systems of equations used to solve for the single
     diode equation parameters. Function designed to be used by
@@ -259,51 +301,108 @@ def _system_of_equations_desoto(params, specs):
     ----------
     params: ndarray
         Array with parameters of the De Soto single diode model. Must be
-        given in the following order: IL, Io, a, Rs, Rsh
+        given in the following order: IL, Io, Rs, Rsh, a
     specs: tuple
-        Specifications of pv module given by manufacturer. Must be given
-        in the following order: Isc, Voc, Imp, Vmp, beta_oc, alpha_sc
+        Specifications of pv module given by manufacturer, as returned by
+        _specs_desoto.
 
     Returns
     -------
-    value of the system of equations to solve with scipy.optimize.root().
+    ndarray of the values of the five equations to solve with
+    scipy.optimize.root().
     """
 
-    # six input known variables
-    Isc, Voc, Imp, Vmp, beta_oc, alpha_sc, EgRef, dEgdT, Tref, k = specs
+    # input known variables
+    Isc, Voc, Imp, Vmp, Voc2, dIL2, T2_Tref, Io2_Io = specs
 
     # five parameters vector to find
     IL, Io, Rs, Rsh, a = params
 
-    # five equation vector
-    y = [0, 0, 0, 0, 0]
-
     # 1st equation - short-circuit - eq(3) in [1]
-    y[0] = Isc - IL + Io * np.expm1(Isc * Rs / a) + Isc * Rs / Rsh
+    y0 = Isc - IL + Io * np.expm1(Isc * Rs / a) + Isc * Rs / Rsh
 
     # 2nd equation - open-circuit Tref - eq(4) in [1]
-    y[1] = -IL + Io * np.expm1(Voc / a) + Voc / Rsh
+    y1 = -IL + Io * np.expm1(Voc / a) + Voc / Rsh
+
+    # diode term at the max power point, shared by the 3rd and 4th equation
+    Emp = np.exp((Vmp + Imp * Rs) / a)
 
     # 3rd equation - Imp & Vmp - eq(5) in [1]
-    y[2] = Imp - IL + Io * np.expm1((Vmp + Imp * Rs) / a) \
-        + (Vmp + Imp * Rs) / Rsh
+    y2 = Imp - IL + Io * (Emp - 1.) + (Vmp + Imp * Rs) / Rsh
 
     # 4th equation - Pmp derivated=0 - eq23.2.6 in [2]
     # caution: eq(6) in [1] has a sign error
-    y[3] = Imp \
-        - Vmp * ((Io / a) * np.exp((Vmp + Imp * Rs) / a) + 1.0 / Rsh) \
-        / (1.0 + (Io * Rs / a) * np.exp((Vmp + Imp * Rs) / a) + Rs / Rsh)
+    y3 = Imp \
+        - Vmp * ((Io / a) * Emp + 1.0 / Rsh) \
+        / (1.0 + (Io * Rs / a) * Emp + Rs / Rsh)
 
     # 5th equation - open-circuit T2 - eq (4) at temperature T2 in [1]
-    T2 = Tref + 2
-    Voc2 = (T2 - Tref) * beta_oc + Voc  # eq (7) in [1]
-    a2 = a * T2 / Tref  # eq (8) in [1]
-    IL2 = IL + alpha_sc * (T2 - Tref)  # eq (11) in [1]
-    Eg2 = EgRef * (1 + dEgdT * (T2 - Tref))  # eq (10) in [1]
-    Io2 = Io * (T2 / Tref)**3 * np.exp(1 / k * (EgRef/Tref - Eg2/T2))  # eq (9)
-    y[4] = -IL2 + Io2 * np.expm1(Voc2 / a2) + Voc2 / Rsh  # eq (4) at T2
+    a2 = a * T2_Tref  # eq (8) in [1]
+    IL2 = IL + dIL2  # eq (11) in [1]
+    Io2 = Io * Io2_Io  # eq (9) in [1]
+    y4 = -IL2 + Io2 * np.expm1(Voc2 / a2) + Voc2 / Rsh  # eq (4) at T2
+
+    return np.array([y0, y1, y2, y3, y4])
 
-    return y
+
+def _jacobian_desoto(params, specs):
+    """Evaluates the Jacobian of the system of equations used to solve for
+    the single diode equation parameters, see _system_of_equations_desoto.
+
+    Parameters
+    ----------
+    params: ndarray
+        Array with parameters of the De Soto single diode model. Must be
+        given in the following order: IL, Io, Rs, Rsh, a
+    specs: tuple
+        Specifications of pv module given by manufacturer, as returned by
+        _specs_desoto.
+
+    Returns
+    -------
+    5x5 array with the partial derivatives of each equation (rows) with
+    respect to each parameter (columns).
+    """
+
+    Isc, Voc, Imp, Vmp, Voc2, dIL2, T2_Tref, Io2_Io = specs
+
+    IL, Io, Rs, Rsh, a = params
+
+    jac = np.empty((5, 5))
+
+    # 1st equation - short-circuit
+    Esc = np.exp(Isc * Rs / a)
+    jac[0] = [-1., np.expm1(Isc * Rs / a), Io * Esc * Isc / a + Isc / Rsh,
+              -Isc * Rs / Rsh**2, -Io * Esc * Isc * Rs / a**2]
+
+    # 2nd equation - open-circuit Tref
+    Eoc = np.exp(Voc / a)
+    jac[1] = [-1., Eoc - 1., 0., -Voc / Rsh**2,
+              -Io * Eoc * Voc / a**2]
+
+    # 3rd equation - Imp & Vmp
+    u = (Vmp + Imp * Rs) / a
+    Emp = np.exp(u)
+    jac[2] = [-1., Emp - 1., Io * Emp * Imp / a + Imp / Rsh,
+              -(Vmp + Imp * Rs) / Rsh**2, -Io * Emp * u / a]
+
+    # 4th equation - Pmp derivated=0, quotient rule for Imp - Vmp * N / D
+    N = (Io / a) * Emp + 1.0 / Rsh
+    D = 1.0 + (Io * Rs / a) * Emp + Rs / Rsh
+    dN = np.array([0., Emp / a, Io * Emp * Imp / a**2, -1. / Rsh**2,
+                   -Io * Emp * (1. + u) / a**2])
+    dD = np.array([0., Rs * Emp / a,
+                   Io * Emp / a * (1. + Rs * Imp / a) + 1. / Rsh,
+                   -Rs / Rsh**2, -Io * Rs * Emp * (1. + u) / a**2])
+    jac[3] = -Vmp * (dN * D - N * dD) / D**2
+
+    # 5th equation - open-circuit T2
+    a2 = a * T2_Tref
+    Eoc2 = np.exp(Voc2 / a2)
+    jac[4] = [-1., Io2_Io * (Eoc2 - 1.), 0., -Voc2 / Rsh**2,
+              -Io * Io2_Io * Eoc2 * Voc2 / (a2 * a)]
+
+    return jac
 
 
 def fit_pvsyst_sandia(ivcurves, specs, const=None, maxiter=5, eps1=1.e-3):
@@ -444,9 +543,10 @@ def fit_pvsyst_sandia(ivcurves, specs, const=None, maxiter=5, eps1=1.e-3):
     # temperature coefficient mu_gamma. Rsh is estimated using the co-content
     # integral method.
 
+    curves = [rectify_iv_curve(ivcurves['v'][j], ivcurves['i'][j])
+              for j in range(n)]
     rsh = np.ones(n)
-    for j in range(n):
-        voltage, current = rectify_iv_curve(ivcurves['v'][j], ivcurves['i'][j])
+    for j, (voltage, current) in enumerate(curves):
         # initial estimate of Rsh, from integral over voltage regression
         # [5] Step 3a; [6] Step 3a
         _, _, _, rsh[j], _ = _fit_sandia_cocontent(
@@ -468,8 +568,7 @@ def fit_pvsyst_sandia(ivcurves, specs, const=None, maxiter=5, eps1=1.e-3):
 
     # For each IV curve, sequentially determine initial values for Io, Rs,
     # and Iph [5] Step 3a; [6] Step 3
-    iph, io, rs, u = _initial_iv_params(ivcurves, ee, voc, isc, rsh,
-                                        nnsvth)
+    iph, io, rs, u = _initial_iv_params(curves, ee, voc, isc, rsh, nnsvth)
 
     # Update values for each IV curve to converge at vmp, imp, voc and isc
     iph, io, rs, rsh, u = _update_iv_params(voc, isc, vmp, imp, ee,
@@ -608,9 +707,10 @@ def fit_desoto_sandia(ivcurves, specs, const=None, maxiter=5, eps1=1.e-3):
     # temperature coefficient mu_gamma. Rsh is estimated using the co-content
     # integral method.
 
+    curves = [rectify_iv_curve(ivcurves['v'][j], ivcurves['i'][j])
+              for j in range(n)]
     rsh = np.ones(n)
-    for j in range(n):
-        voltage, current = rectify_iv_curve(ivcurves['v'][j], ivcurves['i'][j])
+    for j, (voltage, current) in enumerate(curves):
         # initial estimate of Rsh, from integral over voltage regression
         # [5] Step 3a; [6] Step 3a
         _, _, _, rsh[j], _ = _fit_sandia_cocontent(
@@ -629,8 +729,7 @@ def fit_desoto_sandia(ivcurves, specs, const=None, maxiter=5, eps1=1.e-3):
 
     # For each IV curve, sequentially determine initial values for Io, Rs,
     # and Iph [5] Step 3a; [6] Step 3
-    iph, io, rs, u = _initial_iv_params(ivcurves, ee, voc, isc, rsh,
-                                        nnsvth)
+    iph, io, rs, u = _initial_iv_params(curves, ee, voc, isc, rsh, nnsvth)
 
     # Update values for each IV curve to converge at vmp, imp, voc and isc
     iph, io, rs, rsh, u = _update_iv_params(voc, isc, vmp, imp, ee,
@@ -655,12 +754,14 @@ def _fit_pvsyst_sandia_gamma(voc, isc, rsh, vth, tck, specs, const):
     y = np.log(isc - voc / rsh) - 3. * np.log(tck / (const['T0'] + 273.15))
     x1 = const['q'] / const['k'] * (1. / (const['T0'] + 273.15) - 1. / tck)
     x2 = voc / (vth * specs['cells_in_series'])
-    uu = np.logical_or(np.isnan(y), np.isnan(x1), np.isnan(x2))
+    uu = np.isnan(y) | np.isnan(x1) | np.isnan(x2)
 
-    x = np.vstack((np.ones(len(x1[~uu])), x1[~uu], -x1[~uu] *
-                   (tck[~uu] - (const['T0'] + 273.15)), x2[~uu],
-                   -x2[~uu] * (tck[~uu] - (const['T0'] + 273.15)))).T
-    alpha = np.linalg.lstsq(x, y[~uu], rcond=None)[0]
+    x = np.column_stack((np.ones(len(x1[~uu])), x1[~uu], -x1[~uu] *
+                         (tck[~uu] - (const['T0'] + 273.15)), x2[~uu],
+                         -x2[~uu] * (tck[~uu] - (const['T0'] + 273.15))))
+    # QR-based least squares; the normal equations would square the
+    # condition number of x, which is large for typical data
+    alpha = linalg.lstsq(x, y[~uu], lapack_driver='gelsy')[0]
 
     gamma_ref = 1. / alpha[3]
     mu_gamma = alpha[4] / alpha[3] ** 2
@@ -683,62 +784,64 @@ def _fit_desoto_sandia_diode(ee, voc, vth, tc, specs, const):
     return np.array(res.params)[1]
 
 
-def _initial_iv_params(ivcurves, ee, voc, isc, rsh, nnsvth):
+def _initial_iv_params(curves, ee, voc, isc, rsh, nnsvth):
     # sets initial values for iph, io, rs and quality filter u.
-    # Helper function for fit_<model>_sandia.
-    n = len(ivcurves['v_oc'])
-    io = np.ones(n)
-    iph = np.ones(n)
-    rs = np.ones(n)
-
-    for j in range(n):
-
-        if rsh[j] > 0:
-            volt, curr = rectify_iv_curve(ivcurves['v'][j],
-                                          ivcurves['i'][j])
-            # Initial estimate of Io, evaluate the single diode model at
-            # voc and approximate Iph + Io = Isc [5] Step 3a; [6] Step 3b
-            io[j] = (isc[j] - voc[j] / rsh[j]) * np.exp(-voc[j] /
-                                                        nnsvth[j])
-
-            # initial estimate of rs from dI/dV near Voc
-            # [5] Step 3a; [6] Step 3c
-            [didv, d2id2v] = _numdiff(volt, curr)
-            t3 = volt > .5 * voc[j]
-            t4 = volt < .9 * voc[j]
-            tmp = -rsh[j] * didv - 1.
-            with np.errstate(invalid="ignore"):  # expect nan in didv
-                v = np.logical_and.reduce(np.array([t3, t4, ~np.isnan(tmp),
-                                                    np.greater(tmp, 0)]))
-            if np.any(v):
-                vtrs = (nnsvth[j] / isc[j] * (
-                    np.log(tmp[v] * nnsvth[j] / (rsh[j] * io[j]))
-                    - volt[v] / nnsvth[j]))
-                rs[j] = np.mean(vtrs[vtrs > 0], axis=0)
-            else:
-                rs[j] = 0.
-
-            # Initial estimate of Iph, evaluate the single diode model at
-            # Isc [5] Step 3a; [6] Step 3d
-            iph[j] = isc[j] + io[j] * np.expm1(isc[j] / nnsvth[j]) \
-                + isc[j] * rs[j] / rsh[j]
-
-        else:
-            io[j] = np.nan
-            rs[j] = np.nan
-            iph[j] = np.nan
-
-        # Filter IV curves for good initial values
-        # [5] Step 3b
-        u = _filter_params(ee, isc, io, rs, rsh)
-
-        # [5] Step 3c
-        # Refine Io to match Voc
-        io[u] = _update_io(voc[u], iph[u], io[u], rs[u], rsh[u], nnsvth[u])
-
-        # parameters [6], Step 3c
-        # Calculate Iph to be consistent with Isc and current values of other
-        iph = isc + io * np.expm1(rs * isc / nnsvth) + isc * rs / rsh
+    # Helper function for fit_<model>_sandia. curves is a list of rectified
+    # (voltage, current) pairs, one for each IV curve.
+    n = len(curves)
+    good_rsh = rsh > 0
+
+    # Initial estimate of Io, evaluate the single diode model at
+    # voc and approximate Iph + Io = Isc [5] Step 3a; [6] Step 3b
+    io = np.where(good_rsh, (isc - voc / rsh) * np.exp(-voc / nnsvth), np.nan)
+
+    # pad the rectified curves with NaN to a common length so that dI/dV
+    # is computed for all curves at once. NaN padding propagates through
+    # the 5 point difference formula, giving NaN at the last 2 points of
+    # each curve as for an unpadded curve.
+    lmax = max(len(volt) for volt, _ in curves)
+    volt = np.full((n, lmax), np.nan)
+    curr = np.full((n, lmax), np.nan)
+    for j, (v, i) in enumerate(curves):
+        volt[j, :len(v)] = v
+        curr[j, :len(i)] = i
+
+    # initial estimate of rs from dI/dV near Voc
+    # [5] Step 3a; [6] Step 3c
+    didv, _ = _numdiff(volt, curr)
+    voc_col, isc_col, rsh_col, io_col, nnsvth_col = (
+        np.asarray(x, dtype=float)[:, np.newaxis]
+        for x in (voc, isc, rsh, io, nnsvth))
+    tmp = -rsh_col * didv - 1.
+    with np.errstate(invalid="ignore", divide="ignore"):  # expect nan
+        v = (volt > .5 * voc_col) & (volt < .9 * voc_col) & (tmp > 0)
+        vtrs = nnsvth_col / isc_col * (
+            np.log(tmp * nnsvth_col / (rsh_col * io_col))
+            - volt / nnsvth_col)
+        positive = v & (vtrs > 0)
+        # mean of the positive estimates for each curve, nan if there are
+        # none
+        rs = (np.where(positive, vtrs, 0.).sum(axis=1)
+              / positive.sum(axis=1))
+    # rs = 0 for curves with no points in the voltage range
+    rs[~v.any(axis=1)] = 0.
+    rs[~good_rsh] = np.nan
+
+    # Initial estimate of Iph, evaluate the single diode model at
+    # Isc [5] Step 3a; [6] Step 3d
+    iph = isc + io * np.expm1(isc / nnsvth) + isc * rs / rsh
+
+    # Filter IV curves for good initial values
+    # [5] Step 3b
+    u = _filter_params(ee, isc, io, rs, rsh)
+
+    # [5] Step 3c
+    # Refine Io to match Voc
+    io[u] = _update_io(voc[u], iph[u], rsh[u], nnsvth[u])
+
+    # parameters [6], Step 3c
+    # Calculate Iph to be consistent with Isc and current values of other
+    iph = _update_iph(isc, io, rs, rsh, nnsvth)
 
     return iph, io, rs, u
 
@@ -752,33 +855,36 @@ def _update_iv_params(voc, isc, vmp, imp, ee, iph, io, rs, rsh, nnsvth, u,
     prevconvergeparams = {}
     prevconvergeparams['state'] = 0.0
 
-    not_converged = np.array([True])
+    not_converged = True
 
-    while not_converged.any() and counter <= maxiter:
+    while not_converged and counter <= maxiter:
         # update rsh to match max power point using a fixed point method.
         rsh[u] = _update_rsh_fixed_pt(vmp[u], imp[u], iph[u], io[u], rs[u],
                                       rsh[u], nnsvth[u])
 
         # Calculate Rs to be consistent with Rsh and maximum power point
-        _, phi = _calc_theta_phi_exact(vmp[u], imp[u], iph[u], io[u],
-                                       rs[u], rsh[u], nnsvth[u])
+        phi = _calc_phi_exact(imp[u], iph[u], io[u], rsh[u], nnsvth[u])
         rs[u] = (iph[u] + io[u] - imp[u]) * rsh[u] / imp[u] - \
             nnsvth[u] * phi / imp[u] - vmp[u] / imp[u]
 
-        # Update filter for good parameters
-        u = _filter_params(ee, isc, io, rs, rsh)
-
-        # Update value for io to match voc
-        io[u] = _update_io(voc[u], iph[u], io[u], rs[u], rsh[u], nnsvth[u])
+        # Update value for io to match voc. The filter is not updated before
+        # this step: curves whose new rs or rsh is bad are removed by the
+        # filter below, and io is not used in the rs and rsh updates. For
+        # such curves io is therefore also updated, so the io returned for
+        # curves excluded by the final filter may differ from refiltering
+        # here; rs, rsh, iph, u and io[u] are unchanged.
+        io[u] = _update_io(voc[u], iph[u], rsh[u], nnsvth[u])
 
         # Calculate Iph to be consistent with Isc and other parameters
-        iph = isc + io * np.expm1(rs * isc / nnsvth) + isc * rs / rsh
+        iph = _update_iph(isc, io, rs, rsh, nnsvth)
 
         # update filter for good parameters
         u = _filter_params(ee, isc, io, rs, rsh)
 
-        # compute the IV curve from the current parameter values
-        result = singlediode(iph[u], io[u], rs[u], rsh[u], nnsvth[u])
+        # compute the max power point from the current parameter values
+        i_mp, v_mp, p_mp = bishop88_mpp(iph[u], io[u], rs[u], rsh[u],
+                                        nnsvth[u])
+        result = {'i_mp': i_mp, 'v_mp': v_mp, 'p_mp': p_mp}
 
         # check convergence criteria
         # [5] Step 3d
@@ -787,17 +893,16 @@ def _update_iv_params(voc, isc, vmp, imp, ee, iph, io, rs, rsh, nnsvth, u,
 
         prevconvergeparams = convergeparams
         counter += 1.
-        t5 = prevconvergeparams['vmperrmeanchange'] >= eps1
-        t6 = prevconvergeparams['imperrmeanchange'] >= eps1
-        t7 = prevconvergeparams['pmperrmeanchange'] >= eps1
-        t8 = prevconvergeparams['vmperrstdchange'] >= eps1
-        t9 = prevconvergeparams['imperrstdchange'] >= eps1
-        t10 = prevconvergeparams['pmperrstdchange'] >= eps1
-        t11 = prevconvergeparams['vmperrabsmaxchange'] >= eps1
-        t12 = prevconvergeparams['imperrabsmaxchange'] >= eps1
-        t13 = prevconvergeparams['pmperrabsmaxchange'] >= eps1
-        not_converged = np.logical_or.reduce(np.array([t5, t6, t7, t8, t9,
-                                                       t10, t11, t12, t13]))
+        changes = (convergeparams['vmperrmeanchange'],
+                   convergeparams['imperrmeanchange'],
+                   convergeparams['pmperrmeanchange'],
+                   convergeparams['vmperrstdchange'],
+                   convergeparams['imperrstdchange'],
+                   convergeparams['pmperrstdchange'],
+                   convergeparams['vmperrabsmaxchange'],
+                   convergeparams['imperrabsmaxchange'],
+                   convergeparams['pmperrabsmaxchange'])
+        not_converged = any(c >= eps1 for c in changes)
 
     return iph, io, rs, rsh, u
 
@@ -838,14 +943,33 @@ def _extract_sdm_params(ee, tc, iph, io, rs, rsh, n, u, specs, const,
 
         # Find parameters for Rsh equation
 
-        def fun_rsh(x, rshexp, ee, e0, rsh):
-            tf = np.log10(_rsh_pvsyst(x, R_sh_exp, ee, e0)) - np.log10(rsh)
-            return tf
+        # terms of the Rsh equation that do not depend on x = [Rsh0, Rshref]
+        exp_rshexp = np.exp(-R_sh_exp)
+        exp_g = np.exp(-R_sh_exp * ee[u] / const['E0'])
+        log10_rsh = np.log10(rsh[u])
+
+        def rsh_pvsyst(x):
+            # Rsh from the PVsyst model at the irradiance of each curve
+            rshb = max((x[1] - x[0] * exp_rshexp) / (1. - exp_rshexp), 0.)
+            return rshb + (x[0] - rshb) * exp_g
+
+        def fun_rsh(x):
+            return np.log10(rsh_pvsyst(x)) - log10_rsh
+
+        def jac_rsh(x):
+            # derivatives of log10(Rsh) w.r.t. x
+            if x[1] - x[0] * exp_rshexp > 0:
+                drshb = np.array([-exp_rshexp, 1.]) / (1. - exp_rshexp)
+            else:
+                drshb = np.zeros(2)
+            drsh = np.column_stack((drshb[0] + (1. - drshb[0]) * exp_g,
+                                    drshb[1] * (1. - exp_g)))
+            return drsh / (rsh_pvsyst(x) * np.log(10.))[:, np.newaxis]
 
         x0 = np.array([grsh0, grshref])
         beta = optimize.least_squares(
-            fun_rsh, x0, args=(R_sh_exp, ee[u], const['E0'], rsh[u]),
-            bounds=np.array([[1., 1.], [1.e7, 1.e6]]), verbose=2)
+            fun_rsh, x0, jac=jac_rsh,
+            bounds=np.array([[1., 1.], [1.e7, 1.e6]]))
         # Extract PVsyst parameter values
         R_sh_0 = beta.x[0]
         R_sh_ref = beta.x[1]
@@ -903,7 +1027,7 @@ def _extract_sdm_params(ee, tc, iph, io, rs, rsh, n, u, specs, const,
     return params
 
 
-def _update_io(voc, iph, io, rs, rsh, nnsvth):
+def _update_io(voc, iph, rsh, nnsvth):
     """
     Adjusts Io to match Voc using other parameter values.
 
@@ -911,16 +1035,15 @@ def _update_io(voc, iph, io, rs, rsh, nnsvth):
 
     Description
     -----------
-    Io is updated iteratively 10 times or until successive
-    values are less than 0.000001 % different. The updating is similar to
-    Newton's method.
+    At open circuit the current is zero, so the voltage across the series
+    resistance vanishes and the single diode equation can be solved for Io
+    directly. The result is the value to which the Newton-like iteration
+    in [1]_, [2]_ converges.
 
     Parameters
     ----------
     voc: a numpy array of length N of values for Voc (V)
     iph: a numpy array of length N of values for lighbt current IL (A)
-    io: a numpy array of length N of initial values for Io (A)
-    rs: a numpy array of length N of values for the series resistance (ohm)
     rsh: a numpy array of length N of values for the shunt resistance (ohm)
     nnsvth: a numpy array of length N of values for the diode factor x thermal
             voltage for the module, equal to Ns (number of cells in series) x
@@ -938,45 +1061,16 @@ def _update_io(voc, iph, io, rs, rsh, nnsvth):
     .. [3] C. Hansen, Estimation of Parameteres for Single Diode Models using
        Measured IV Curves, Proc. of the 39th IEEE PVSC, June 2013.
     """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (iph - voc / rsh) / np.expm1(voc / nnsvth)
 
-    eps = 1e-6
-    niter = 10
-    k = 1
-    maxerr = 1
-
-    tio = io  # Current Estimate of Io
-
-    while maxerr > eps and k < niter:
-        # Predict Voc
-        pvoc = v_from_i(0., iph, tio, rs, rsh, nnsvth)
-
-        # Difference in Voc
-        dvoc = pvoc - voc
-
-        # Update Io
-        with np.errstate(invalid="ignore", divide="ignore"):
-            new_io = tio * (1. + (2. * dvoc) / (2. * nnsvth - dvoc))
-            # Calculate Maximum Percent Difference
-            maxerr = np.max(np.abs(new_io - tio) / tio) * 100.
-
-        tio = new_io
-        k += 1.
-
-    return new_io
 
-
-def _rsh_pvsyst(x, rshexp, g, go):
-    # computes rsh for PVsyst model where the parameters are in vector xL
-    # x[0] = Rsh0
-    # x[1] = Rshref
-
-    rsho = x[0]
-    rshref = x[1]
-
-    rshb = np.maximum(
-        (rshref - rsho * np.exp(-rshexp)) / (1. - np.exp(-rshexp)), 0.)
-    rsh = rshb + (rsho - rshb) * np.exp(-rshexp * g / go)
-    return rsh
+def _update_iph(isc, io, rs, rsh, nnsvth):
+    # computes Iph consistent with Isc and the other parameters, i.e., the
+    # single diode equation evaluated at short circuit.
+    # Helper function for fit_pvsyst_sandia, fit_desoto_sandia
+    isc_rs = isc * rs
+    return isc + io * np.expm1(isc_rs / nnsvth) + isc_rs / rsh
 
 
 def _filter_params(ee, isc, io, rs, rsh):
@@ -985,28 +1079,28 @@ def _filter_params(ee, isc, io, rs, rsh):
     # where effective irradiance Ee differs by more than 5% from a linear fit
     # to Isc vs. Ee
 
-    badrsh = np.logical_or(rsh < 0., np.isnan(rsh))
-    negrs = rs < 0.
-    badrs = np.logical_or(rs > rsh, np.isnan(rs))
-    imagrs = ~(np.isreal(rs))
-    badio = np.logical_or(np.logical_or(~(np.isreal(rs)), io <= 0),
-                          np.isnan(io))
-    goodr = np.logical_and(~badrsh, ~imagrs)
-    goodr = np.logical_and(goodr, ~negrs)
-    goodr = np.logical_and(goodr, ~badrs)
-    goodr = np.logical_and(goodr, ~badio)
-
-    matrix = np.vstack((ee / 1000., np.zeros(len(ee)))).T
-    eff = np.linalg.lstsq(matrix, isc, rcond=None)[0][0]
-    pisc = eff * ee / 1000
+    # comparisons with NaN are False, hence NaN parameters are not good
+    goodr = (rsh >= 0.) & (rs >= 0.) & (rs <= rsh) & (io > 0.)
+
+    # least squares fit of Isc = eff * Ee / 1000, i.e., through the origin
+    x = ee / 1000.
+    eff = np.dot(x, isc) / np.dot(x, x)
+    pisc = eff * x
     pisc_error = np.abs(pisc - isc) / isc
     # check for departure from linear relation between Isc and Ee
     badiph = pisc_error > .05
 
-    u = np.logical_and(goodr, ~badiph)
+    u = goodr & ~badiph
     return u
 
 
+def _std_ddof1(x, mean):
+    # sample standard deviation (ddof=1) along the last axis of x given its
+    # mean, to avoid computing the mean a second time as np.std does
+    return np.sqrt(np.sum((x - mean[..., np.newaxis]) ** 2, axis=-1)
+                   / (x.shape[-1] - 1))
+
+
 def _check_converge(prevparams, result, vmp, imp, i):
     """
     Function _check_converge computes convergence metrics for all IV curves.
@@ -1047,64 +1141,35 @@ def _check_converge(prevparams, result, vmp, imp, i):
     vmperror = (result['v_mp'] - vmp) / vmp * 100.
     pmperror = (result['p_mp'] - (imp * vmp)) / (imp * vmp) * 100.
 
-    convergeparam['imperrmax'] = max(imperror)  # max of the error in Imp
-    convergeparam['imperrmin'] = min(imperror)  # min of the error in Imp
-    # max of the absolute error in Imp
-    convergeparam['imperrabsmax'] = max(abs(imperror))
-    # mean of the error in Imp
-    convergeparam['imperrmean'] = np.mean(imperror, axis=0)
-    # std of the error in Imp
-    convergeparam['imperrstd'] = np.std(imperror, axis=0, ddof=1)
-
-    convergeparam['vmperrmax'] = max(vmperror)  # max of the error in Vmp
-    convergeparam['vmperrmin'] = min(vmperror)  # min of the error in Vmp
-    # max of the absolute error in Vmp
-    convergeparam['vmperrabsmax'] = max(abs(vmperror))
-    # mean of the error in Vmp
-    convergeparam['vmperrmean'] = np.mean(vmperror, axis=0)
-    # std of the error in Vmp
-    convergeparam['vmperrstd'] = np.std(vmperror, axis=0, ddof=1)
-
-    convergeparam['pmperrmax'] = max(pmperror)  # max of the error in Pmp
-    convergeparam['pmperrmin'] = min(pmperror)  # min of the error in Pmp
-    # max of the abs err. in Pmp
-    convergeparam['pmperrabsmax'] = max(abs(pmperror))
-    # mean error in Pmp
-    convergeparam['pmperrmean'] = np.mean(pmperror, axis=0)
-    # std error Pmp
-    convergeparam['pmperrstd'] = np.std(pmperror, axis=0, ddof=1)
-
+    # statistics of the errors in Imp, Vmp and Pmp, one row each, so that
+    # each statistic is computed with a single reduction
+    errors = np.array([imperror, vmperror, pmperror], dtype=float)
+    errmax = np.max(errors, axis=1)  # max of the error
+    errmin = np.min(errors, axis=1)  # min of the error
+    errabsmax = np.max(np.abs(errors), axis=1)  # max of the absolute error
+    errmean = np.mean(errors, axis=1)  # mean of the error
+    errstd = _std_ddof1(errors, errmean)  # std of the error
+
+    names = ('imp', 'vmp', 'pmp')
+    for k, name in enumerate(names):
+        convergeparam[name + 'errmax'] = errmax[k]
+        convergeparam[name + 'errmin'] = errmin[k]
+        convergeparam[name + 'errabsmax'] = errabsmax[k]
+        convergeparam[name + 'errmean'] = errmean[k]
+        convergeparam[name + 'errstd'] = errstd[k]
+
+    # relative changes of the statistics from the previous iteration
+    keys = [name + stat for stat in ('errstd', 'errmean', 'errabsmax')
+            for name in names]
     if prevparams['state'] != 0.0:
-        convergeparam['imperrstdchange'] = np.abs(
-            convergeparam['imperrstd'] / prevparams['imperrstd'] - 1.)
-        convergeparam['vmperrstdchange'] = np.abs(
-            convergeparam['vmperrstd'] / prevparams['vmperrstd'] - 1.)
-        convergeparam['pmperrstdchange'] = np.abs(
-            convergeparam['pmperrstd'] / prevparams['pmperrstd'] - 1.)
-        convergeparam['imperrmeanchange'] = np.abs(
-            convergeparam['imperrmean'] / prevparams['imperrmean'] - 1.)
-        convergeparam['vmperrmeanchange'] = np.abs(
-            convergeparam['vmperrmean'] / prevparams['vmperrmean'] - 1.)
-        convergeparam['pmperrmeanchange'] = np.abs(
-            convergeparam['pmperrmean'] / prevparams['pmperrmean'] - 1.)
-        convergeparam['imperrabsmaxchange'] = np.abs(
-            convergeparam['imperrabsmax'] / prevparams['imperrabsmax'] - 1.)
-        convergeparam['vmperrabsmaxchange'] = np.abs(
-            convergeparam['vmperrabsmax'] / prevparams['vmperrabsmax'] - 1.)
-        convergeparam['pmperrabsmaxchange'] = np.abs(
-            convergeparam['pmperrabsmax'] / prevparams['pmperrabsmax'] - 1.)
-        convergeparam['state'] = 1.0
+        current = np.array([convergeparam[key] for key in keys])
+        previous = np.array([prevparams[key] for key in keys])
+        changes = np.abs(current / previous - 1.)
     else:
-        convergeparam['imperrstdchange'] = float("Inf")
-        convergeparam['vmperrstdchange'] = float("Inf")
-        convergeparam['pmperrstdchange'] = float("Inf")
-        convergeparam['imperrmeanchange'] = float("Inf")
-        convergeparam['vmperrmeanchange'] = float("Inf")
-        convergeparam['pmperrmeanchange'] = float("Inf")
-        convergeparam['imperrabsmaxchange'] = float("Inf")
-        convergeparam['vmperrabsmaxchange'] = float("Inf")
-        convergeparam['pmperrabsmaxchange'] = float("Inf")
-        convergeparam['state'] = 1.
+        changes = np.full(len(keys), np.inf)
+    for key, change in zip(keys, changes):
+        convergeparam[key + 'change'] = change
+    convergeparam['state'] = 1.
     return convergeparam
 
 
@@ -1118,8 +1183,9 @@ def _update_rsh_fixed_pt(vmp, imp, iph, io, rs, rsh, nnsvth):
     -----------
     Rsh is updated iteratively using a fixed point expression
     obtained from combining Vmp = Vmp(Imp) (using the analytic solution to the
-    single diode equation) and dP / dI = 0 at Imp. 500 iterations are performed
-    because convergence can be very slow.
+    single diode equation) and dP / dI = 0 at Imp. Up to 500 iterations are
+    performed because convergence can be very slow; iteration stops early
+    once no value changes by more than a relative 1e-10.
 
     Parameters
     ----------
@@ -1146,16 +1212,61 @@ def _update_rsh_fixed_pt(vmp, imp, iph, io, rs, rsh, nnsvth):
     niter = 500
     x1 = rsh
 
+    # terms of the log of the Lambert W argument for phi, see
+    # _calc_phi_exact, that do not depend on rsh
+    with np.errstate(divide="ignore", invalid="ignore"):
+        io_nnsvth = np.where(nnsvth == 0, np.nan, np.divide(io, nnsvth))
+        dexp = np.divide(iph + io - imp, nnsvth)
+    # terms of the fixed point expression that do not depend on rsh
+    iphio_imp = (iph + io) / imp
+    nnsvth_imp = nnsvth / imp
+    two_vmp_imp = 2 * vmp / imp
+
     for i in range(niter):
-        _, z = _calc_theta_phi_exact(vmp, imp, iph, io, rs, x1, nnsvth)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = _lambertw_log(np.log(x1 * io_nnsvth) + x1 * dexp)
         with np.errstate(divide="ignore"):
-            next_x1 = (1 + z) / z * ((iph + io) * x1 / imp - nnsvth * z / imp
-                                     - 2 * vmp / imp)
+            next_x1 = (1 + z) / z * (iphio_imp * x1 - nnsvth_imp * z
+                                     - two_vmp_imp)
+        if i % 20 == 19:
+            # stop early once no value of Rsh is changing any more
+            with np.errstate(invalid="ignore"):
+                converged = np.abs(next_x1 - x1) <= 1e-10 * np.abs(x1)
+            if np.all(converged | (np.isnan(next_x1) & np.isnan(x1))):
+                return next_x1
         x1 = next_x1
 
     return x1
 
 
+def _lambertw_log(logx):
+    # Lambert W function of x = exp(logx) for real x > 0, i.e., the solution
+    # w of w + log(w) = logx; NaN where x is not positive. Working with
+    # log(x) avoids overflow of x. For logx > 1, four iterations of Newton's
+    # method starting from w = logx give full double precision at a fraction
+    # of the cost of scipy.special.lambertw, which is used for logx <= 1.
+    logx = np.asarray(logx, dtype=float)
+
+    big = logx > 1.
+    all_big = big.all()
+    # typical during parameter fitting; skip the masked copies
+    x = logx if all_big else logx[big]
+    wb = x.copy()
+    with np.errstate(invalid="ignore"):  # logx = inf gives nan
+        for _ in range(4):
+            wb *= (1. - np.log(wb) + x) / (1. + wb)
+    if all_big:
+        return wb
+
+    w = np.full(logx.shape, np.nan)
+    w[big] = wb
+
+    # exclude x = 0, i.e., logx = -inf
+    small = (logx <= 1.) & (logx > -np.inf)
+    w[small] = lambertw(np.exp(logx[small])).real
+    return w
+
+
 def _calc_theta_phi_exact(vmp, imp, iph, io, rs, rsh, nnsvth):
     """
     _calc_theta_phi_exact computes Lambert W values appearing in the analytic
@@ -1210,61 +1321,63 @@ def _calc_theta_phi_exact(vmp, imp, iph, io, rs, rsh, nnsvth):
     rsh = np.asarray(rsh)
     nnsvth = np.asarray(nnsvth)
 
-    # Argument for Lambert W function involved in V = V(I) [2] Eq. 12; [3]
-    # Eq. 3
-    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
-        argw = np.where(
+    phi = _calc_phi_exact(imp, iph, io, rsh, nnsvth)
+
+    # Lambert W function involved in I = I(V) [2] Eq. 11; [3] Eq. 2,
+    # evaluated from the log of its argument to avoid overflow
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsh_frac = rsh / (rsh + rs)
+        logargw = np.where(
             nnsvth == 0,
             np.nan,
-            rsh * io / nnsvth * np.exp(rsh * (iph + io - imp) / nnsvth))
-        phi = np.where(argw > 0, lambertw(argw).real, np.nan)
-
-    # NaN where argw overflows. Switch to log space to evaluate
-    u = np.isinf(argw)
-    if np.any(u):
-        logargw = (
-            np.log(rsh[u]) + np.log(io[u]) - np.log(nnsvth[u])
-            + rsh[u] * (iph[u] + io[u] - imp[u]) / nnsvth[u])
-        # Three iterations of Newton-Raphson method to solve w+log(w)=logargW.
-        # The initial guess is w=logargW. Where direct evaluation (above)
-        # results in NaN from overflow, 3 iterations of Newton's method gives
-        # approximately 8 digits of precision.
-        x = logargw
-        for i in range(3):
-            x *= ((1. - np.log(x) + logargw) / (1. + x))
-        phi[u] = x
-    phi = np.transpose(phi)
-
-    # Argument for Lambert W function involved in I = I(V) [2] Eq. 11; [3]
-    # E1. 2
-    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
-        argw = np.where(
+            np.log(rsh_frac * rs * io / nnsvth)
+            + rsh_frac * (rs * (iph + io) + vmp) / nnsvth)
+    theta = _lambertw_log(logargw)
+
+    return theta, phi
+
+
+def _calc_phi_exact(imp, iph, io, rsh, nnsvth):
+    """
+    _calc_phi_exact computes the Lambert W value appearing in the analytic
+    solution V = V(I) to the single diode equation at the max power point.
+    See _calc_theta_phi_exact.
+
+    Helper function for fit_pvsyst_sandia, fit_desoto_sandia
+
+    Parameters
+    ----------
+    imp: a numpy array of length N of values for Imp (A)
+    iph: a numpy array of length N of values for the light current IL (A)
+    io: a numpy array of length N of values for Io (A)
+    rsh: a numpy array of length N of values for the shunt resistance (ohm)
+    nnsvth: a numpy array of length N of values for the diode factor x
+            thermal voltage for the module, equal to Ns
+            (number of cells in series) x Vth
+            (thermal voltage per cell).
+
+    Returns
+    -------
+    phi: a numpy array of values for the Lambert W function for solving
+         V = V(I)
+    """
+    # handle singleton inputs
+    imp = np.asarray(imp)
+    iph = np.asarray(iph)
+    io = np.asarray(io)
+    rsh = np.asarray(rsh)
+    nnsvth = np.asarray(nnsvth)
+
+    # Lambert W function involved in V = V(I) [2] Eq. 12; [3] Eq. 3,
+    # evaluated from the log of its argument to avoid overflow
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logargw = np.where(
             nnsvth == 0,
             np.nan,
-            rsh / (rsh + rs) * rs * io / nnsvth * np.exp(
-                rsh / (rsh + rs) * (rs * (iph + io) + vmp) / nnsvth))
-        theta = np.where(argw > 0, lambertw(argw).real, np.nan)
+            np.log(rsh * io / nnsvth) + rsh * (iph + io - imp) / nnsvth)
+    phi = _lambertw_log(logargw)
 
-    # NaN where argw overflows. Switch to log space to evaluate
-    u = np.isinf(argw)
-    if np.any(u):
-        with np.errstate(divide="ignore"):
-            logargw = (
-                np.log(rsh[u]) - np.log(rsh[u] + rs[u]) + np.log(rs[u])
-                + np.log(io[u]) - np.log(nnsvth[u])
-                + (rsh[u] / (rsh[u] + rs[u]))
-                * (rs[u] * (iph[u] + io[u]) + vmp[u]) / nnsvth[u])
-        # Three iterations of Newton-Raphson method to solve w+log(w)=logargW.
-        # The initial guess is w=logargW. Where direct evaluation (above)
-        # results in NaN from overflow, 3 iterations of Newton's method gives
-        # approximately 8 digits of precision.
-        x = logargw
-        for i in range(3):
-            x *= ((1. - np.log(x) + logargw) / (1. + x))
-        theta[u] = x
-    theta = np.transpose(theta)
-
-    return theta, phi
+    return phi
 
 
 def pvsyst_temperature_coeff(alpha_sc, gamma_ref, mu_gamma, I_L_ref, I_o_ref,
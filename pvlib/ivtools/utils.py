@@ -23,19 +23,20 @@ def _numdiff(x, f):
     Parameters
     ----------
     x : numeric
-        a numpy array of values of x
+        a numpy array of values of x. Derivatives are computed along the
+        last axis, so a 2-D array may hold one set of values per row.
     f : numeric
         a numpy array of values of the function f for which derivatives are to
-        be computed. Must be the same length as x.
+        be computed. Must be the same shape as x.
 
     Returns
     -------
     df : numeric
-        a numpy array of len(x) containing the first derivative of f at each
-        point x except at the first 2 and last 2 points
+        a numpy array the same shape as x containing the first derivative of
+        f at each point x except at the first 2 and last 2 points
     df2 : numeric
-        a numpy array of len(x) containing the second derivative of f at each
-        point x except at the first 2 and last 2 points.
+        a numpy array the same shape as x containing the second derivative of
+        f at each point x except at the first 2 and last 2 points.
 
     Notes
     -----
@@ -53,25 +54,29 @@ def _numdiff(x, f):
     .. [2] PVLib MATLAB https://github.com/sandialabs/MATLAB_PV_LIB
     """
 
-    n = len(f)
+    x = np.asarray(x, dtype=float)
+    f = np.asarray(f, dtype=float)
 
-    df = np.zeros(n)
-    df2 = np.zeros(n)
+    df = np.zeros(f.shape)
+    df2 = np.zeros(f.shape)
 
     # first two points are special
-    df[:2] = float("Nan")
-    df2[:2] = float("Nan")
+    df[..., :2] = float("Nan")
+    df2[..., :2] = float("Nan")
 
     # Last two points are special
-    df[-2:] = float("Nan")
-    df2[-2:] = float("Nan")
+    df[..., -2:] = float("Nan")
+    df2[..., -2:] = float("Nan")
 
     # Rest of points. Take reference point to be the middle of each group of 5
-    # points. Calculate displacements
-    ff = np.vstack((f[:-4], f[1:-3], f[2:-2], f[3:-1], f[4:])).T
+    # points. Calculate displacements. Leading axes are flattened so that each
+    # row of ff and a0 holds one group of 5 points.
+    ff = np.stack((f[..., :-4], f[..., 1:-3], f[..., 2:-2], f[..., 3:-1],
+                   f[..., 4:]), axis=-1).reshape(-1, 5)
 
-    a0 = (np.vstack((x[:-4], x[1:-3], x[2:-2], x[3:-1], x[4:])).T
-          - np.tile(x[2:-2], [5, 1]).T)
+    a0 = (np.stack((x[..., :-4], x[..., 1:-3], x[..., 2:-2], x[..., 3:-1],
+                    x[..., 4:]), axis=-1)
+          - x[..., 2:-2, np.newaxis]).reshape(-1, 5)
 
     u1 = np.zeros(a0.shape)
     left = np.zeros(a0.shape)
@@ -104,7 +109,8 @@ def _numdiff(x, f):
     left[:, 4] = (a0[:, 4] - a0[:, 0]) * (a0[:, 4] - a0[:, 1]) * \
         (a0[:, 4] - a0[:, 2]) * (a0[:, 4] - a0[:, 3])
 
-    df[2:-2] = np.sum(-(u1 / left) * ff, axis=1)
+    inner = x[..., 2:-2].shape
+    df[..., 2:-2] = np.sum(-(u1 / left) * ff, axis=1).reshape(inner)
 
     # second derivative
     u2[:, 0] = (
@@ -123,7 +129,7 @@ def _numdiff(x, f):
         a0[:, 0] * a0[:, 1] + a0[:, 0] * a0[:, 2] + a0[:, 0] * a0[:, 3]
         + a0[:, 1] * a0[:, 2] + a0[:, 1] * a0[:, 4] + a0[:, 2] * a0[:, 3])
 
-    df2[2:-2] = 2. * np.sum(u2 * ff, axis=1)
+    df2[..., 2:-2] = 2. * np.sum(u2 * ff, axis=1).reshape(inner)
     return df, df2
 
 
@@ -158,24 +164,22 @@ def rectify_iv_curve(voltage, current, decimals=None):
       equal to the average of current at duplicated voltages.
     """
 
-    df = pd.DataFrame(data=np.vstack((voltage, current)).T, columns=['v', 'i'])
-    # restrict to first quadrant
-    df.dropna(inplace=True)
-    df = df[(df['v'] >= 0) & (df['i'] >= 0)]
-    # sort pairs on voltage, then current
-    df = df.sort_values(by=['v', 'i'], ascending=[True, False])
+    voltage = np.asarray(voltage, dtype=float)
+    current = np.asarray(current, dtype=float)
+    # restrict to first quadrant, comparisons with NaN are False
+    keep = (voltage >= 0) & (current >= 0)
+    voltage = voltage[keep]
+    current = current[keep]
 
     # eliminate duplicate voltage points
     if decimals is not None:
-        df['v'] = np.round(df['v'], decimals=decimals)
+        voltage = np.round(voltage, decimals=decimals)
 
-    _, inv = np.unique(df['v'], return_inverse=True)
-    df.index = inv
+    voltage, inv = np.unique(voltage, return_inverse=True)
     # average current at each common voltage
-    df = df.groupby(by=inv).mean()
+    current = np.bincount(inv, weights=current) / np.bincount(inv)
 
-    tmp = np.array(df).T
-    return tmp[0, ], tmp[1, ]
+    return voltage, current
 
 
 def _schumaker_qspline(x, y):
@@ -414,7 +418,7 @@ def _schumaker_qspline(x, y):
     yk[n + q + r + ss - 1] = y[n - 1]
     flag[(n - 1):(n + q + r + ss - 1)] = True  # these are all inserted knots
 
-    tmp = np.vstack((xk, a.T, yk, flag)).T
+    tmp = np.column_stack((xk, a, yk, flag))
     # sort output in terms of increasing x (original plus added knots)
     tmp2 = tmp[tmp[:, 0].argsort(kind='mergesort')]
 
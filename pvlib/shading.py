@@ -5,7 +5,7 @@ associated effects on PV module output
 
 import numpy as np
 import pandas as pd
-from pvlib.tools import sind, cosd
+from pvlib.tools import cosd
 
 
 def ground_angle(surface_tilt, gcr, slant_height):
@@ -43,8 +43,10 @@ def ground_angle(surface_tilt, gcr, slant_height):
     #  :         \  v      *-.\
     #  :          \<-----P---->\
 
-    x1 = gcr * slant_height * sind(surface_tilt)
-    x2 = gcr * slant_height * cosd(surface_tilt) + 1
+    beta = np.deg2rad(surface_tilt)
+    gcr_height = gcr * slant_height
+    x1 = gcr_height * np.sin(beta)
+    x2 = gcr_height * np.cos(beta) + 1
     psi = np.arctan2(x1, x2)  # do this before rad2deg because it handles 0 / 0
     return np.rad2deg(psi)
 
@@ -93,8 +95,10 @@ def masking_angle(surface_tilt, gcr, slant_height):
     # The original equation (8 in [1]) requires pitch and collector width,
     # but it's easy to non-dimensionalize it to make it a function of GCR
     # by factoring out B from the argument to arctan.
-    numerator = gcr * (1 - slant_height) * sind(surface_tilt)
-    denominator = 1 - gcr * (1 - slant_height) * cosd(surface_tilt)
+    beta = np.deg2rad(surface_tilt)
+    gcr_height = gcr * (1 - slant_height)
+    numerator = gcr_height * np.sin(beta)
+    denominator = 1 - gcr_height * np.cos(beta)
     phi = np.arctan(numerator / denominator)
     return np.degrees(phi)
 
@@ -170,25 +174,30 @@ def masking_angle_passias(surface_tilt, gcr):
        :doi:`10.1016/0379-6787(84)90017-6`
     """
     # wrap it in an array so that division by zero is handled well
-    beta = np.radians(np.array(surface_tilt))
+    beta = np.radians(np.asarray(surface_tilt))
     sin_b = np.sin(beta)
     cos_b = np.cos(beta)
     X = 1/gcr
 
+    # products shared by the terms below
+    x_cos_b = X * cos_b
+    x_sin_b = X * sin_b
+    x_cos_b_m1 = x_cos_b - 1
+
     with np.errstate(divide='ignore', invalid='ignore'):  # ignore beta=0
-        term1 = -X * sin_b * np.log(np.abs(2 * X * cos_b - (X**2 + 1))) / 2
-        term2 = (X * cos_b - 1) * np.arctan((X * cos_b - 1) / (X * sin_b))
-        term3 = (1 - X * cos_b) * np.arctan(cos_b / sin_b)
+        term1 = -x_sin_b * np.log(np.abs(2 * x_cos_b - (X**2 + 1))) / 2
+        term2 = x_cos_b_m1 * np.arctan(x_cos_b_m1 / x_sin_b)
+        term3 = -x_cos_b_m1 * np.arctan(cos_b / sin_b)
         term4 = X * np.log(X) * sin_b
 
     psi_avg = term1 + term2 + term3 + term4
     # when beta=0, divide by zero makes psi_avg NaN.  replace with 0:
-    psi_avg = np.where(np.isfinite(psi_avg), psi_avg, 0)
+    psi_avg = np.degrees(np.where(np.isfinite(psi_avg), psi_avg, 0))
 
     if isinstance(surface_tilt, pd.Series):
         psi_avg = pd.Series(psi_avg, index=surface_tilt.index)
 
-    return np.degrees(psi_avg)
+    return psi_avg
 
 
 def sky_diffuse_passias(masking_angle):
@@ -322,22 +331,25 @@ def projected_solar_zenith_angle(solar_zenith, solar_azimuth,
     # Since elevation = 90 - zenith, sin(90-x) = cos(x) & cos(90-x) = sin(x):
     # Notation from [1], modified to use zenith instead of elevation
     # cos(elevation) = sin(zenith) and sin(elevation) = cos(zenith)
-    # Avoid recalculating these values
-    sind_solar_zenith = sind(solar_zenith)
-    cosd_axis_azimuth = cosd(axis_azimuth)
-    sind_axis_azimuth = sind(axis_azimuth)
-    sind_axis_tilt = sind(axis_tilt)
+    # Convert each angle to radians once and avoid recalculating the
+    # trigonometric values
+    solar_zenith = np.radians(solar_zenith)
+    solar_azimuth = np.radians(solar_azimuth)
+    axis_tilt = np.radians(axis_tilt)
+    axis_azimuth = np.radians(axis_azimuth)
+    sin_solar_zenith = np.sin(solar_zenith)
+    cos_axis_azimuth = np.cos(axis_azimuth)
+    sin_axis_azimuth = np.sin(axis_azimuth)
 
     # Sun's x, y, z coords
-    sx = sind_solar_zenith * sind(solar_azimuth)
-    sy = sind_solar_zenith * cosd(solar_azimuth)
-    sz = cosd(solar_zenith)
+    sx = sin_solar_zenith * np.sin(solar_azimuth)
+    sy = sin_solar_zenith * np.cos(solar_azimuth)
+    sz = np.cos(solar_zenith)
     # Eq. (4); sx', sz' values from sun coordinates projected onto surface
-    sx_prime = sx * cosd_axis_azimuth - sy * sind_axis_azimuth
+    sx_prime = sx * cos_axis_azimuth - sy * sin_axis_azimuth
     sz_prime = (
-        sx * sind_axis_azimuth * sind_axis_tilt
-        + sy * sind_axis_tilt * cosd_axis_azimuth
-        + sz * cosd(axis_tilt)
+        (sx * sin_axis_azimuth + sy * cos_axis_azimuth) * np.sin(axis_tilt)
+        + sz * np.cos(axis_tilt)
     )
     # Eq. (5); angle between sun's beam and surface
     theta_T = np.degrees(np.arctan2(sx_prime, sz_prime))
@@ -5,5 +5,6 @@ from pvlib.spectrum.mismatch import (  # noqa: F401
     get_example_spectral_response,
     spectral_factor_caballero,
     spectral_factor_firstsolar,
+    spectral_factor_firstsolar_batch,
     spectral_factor_sapm,
 )
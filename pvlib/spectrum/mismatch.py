@@ -5,12 +5,31 @@ The ``mismatch`` module provides functions for spectral mismatch calculations.
 import pvlib
 import numpy as np
 import pandas as pd
-from scipy.interpolate import interp1d
+from scipy.interpolate import CubicSpline
 import os
+import functools
 
 from warnings import warn
 
 
+# points defining the cubic spline of get_example_spectral_response
+_EXAMPLE_SR_DATA = np.array([[ 290, 0.00],
+                             [ 350, 0.27],
+                             [ 400, 0.37],
+                             [ 500, 0.52],
+                             [ 650, 0.71],
+                             [ 800, 0.88],
+                             [ 900, 0.97],
+                             [ 950, 1.00],
+                             [1000, 0.93],
+                             [1050, 0.58],
+                             [1100, 0.21],
+                             [1150, 0.05],
+                             [1190, 0.00]]).transpose()
+_EXAMPLE_SR_SPLINE = CubicSpline(_EXAMPLE_SR_DATA[0], _EXAMPLE_SR_DATA[1],
+                                 extrapolate=False)
+
+
 def get_example_spectral_response(wavelength=None):
     '''
     Generate a generic smooth spectral response (SR) for tests and experiments.
@@ -43,32 +62,13 @@ def get_example_spectral_response(wavelength=None):
     '''
     # Contributed by Anton Driesse (@adriesse), PV Performance Labs. Aug. 2022
 
-    SR_DATA = np.array([[ 290, 0.00],
-                        [ 350, 0.27],
-                        [ 400, 0.37],
-                        [ 500, 0.52],
-                        [ 650, 0.71],
-                        [ 800, 0.88],
-                        [ 900, 0.97],
-                        [ 950, 1.00],
-                        [1000, 0.93],
-                        [1050, 0.58],
-                        [1100, 0.21],
-                        [1150, 0.05],
-                        [1190, 0.00]]).transpose()
-
     if wavelength is None:
         resolution = 5.0
         wavelength = np.arange(280, 1200 + resolution, resolution)
 
-    interpolator = interp1d(SR_DATA[0], SR_DATA[1],
-                            kind='cubic',
-                            bounds_error=False,
-                            fill_value=0.0,
-                            copy=False,
-                            assume_sorted=True)
-
-    sr = pd.Series(data=interpolator(wavelength), index=wavelength)
+    # the spline is zero outside the range of the defining points
+    sr = np.nan_to_num(_EXAMPLE_SR_SPLINE(wavelength), nan=0.0)
+    sr = pd.Series(data=sr, index=wavelength)
 
     sr.index.name = 'wavelength'
     sr.name = 'spectral_response'
@@ -119,20 +119,10 @@ def get_am15g(wavelength=None):
     '''
     # Contributed by Anton Driesse (@adriesse), PV Performance Labs. Aug. 2022
 
-    pvlib_path = pvlib.__path__[0]
-    filepath = os.path.join(pvlib_path, 'data', 'astm_g173_am15g.csv')
-
-    am15g = pd.read_csv(filepath, index_col=0).squeeze()
-
     if wavelength is not None:
-        interpolator = interp1d(am15g.index, am15g,
-                                kind='linear',
-                                bounds_error=False,
-                                fill_value=0.0,
-                                copy=False,
-                                assume_sorted=True)
-
-        am15g = pd.Series(data=interpolator(wavelength), index=wavelength)
+        am15g = pd.Series(data=_interp_am15g(wavelength), index=wavelength)
+    else:
+        am15g = _read_am15g().copy()
 
     am15g.index.name = 'wavelength'
     am15g.name = 'am15g'
@@ -140,6 +130,21 @@ def get_am15g(wavelength=None):
     return am15g
 
 
+@functools.lru_cache(maxsize=1)
+def _read_am15g():
+    # the data file is parsed on the first call only; callers must not
+    # modify the returned Series
+    pvlib_path = pvlib.__path__[0]
+    filepath = os.path.join(pvlib_path, 'data', 'astm_g173_am15g.csv')
+    return pd.read_csv(filepath, index_col=0, dtype=float).squeeze('columns')
+
+
+def _interp_am15g(wavelength):
+    # the AM1.5G spectrum linearly interpolated to wavelength, as an array
+    am15g = _read_am15g()
+    return np.interp(wavelength, am15g.index, am15g, left=0.0, right=0.0)
+
+
 def calc_spectral_mismatch_field(sr, e_sun, e_ref=None):
     """
     Calculate spectral mismatch between a test device and broadband reference
@@ -213,22 +218,39 @@ def calc_spectral_mismatch_field(sr, e_sun, e_ref=None):
     """
     # Contributed by Anton Driesse (@adriesse), PV Performance Labs. Aug. 2022
 
+    # wavelengths of the spectra; taken from the columns of a DataFrame
+    # directly, since e.T.index would first build the transposed DataFrame
+    def wavelengths(e):
+        return e.columns if isinstance(e, pd.DataFrame) else e.index
+
+    wl_sun = wavelengths(e_sun)
+
     # get the reference spectrum at wavelengths matching the measured spectra
     if e_ref is None:
-        e_ref = get_am15g(wavelength=e_sun.T.index)
+        wl_ref = wl_sun
+        e_ref = _interp_am15g(wl_sun)
+    else:
+        wl_ref = wavelengths(e_ref)
+        e_ref = e_ref.to_numpy()
 
     # interpolate the sr at the wavelengths of the spectra
     # reference spectrum wavelengths may differ if e_ref is from caller
-    sr_sun = np.interp(e_sun.T.index, sr.index, sr, left=0.0, right=0.0)
-    sr_ref = np.interp(e_ref.T.index, sr.index, sr, left=0.0, right=0.0)
-
-    # a helper function to make usable fraction calculations more readable
-    def integrate(e):
-        return np.trapz(e, x=e.T.index, axis=-1)
+    sr_sun = np.interp(wl_sun, sr.index, sr, left=0.0, right=0.0)
+    sr_ref = np.interp(wl_ref, sr.index, sr, left=0.0, right=0.0)
+
+    # a helper function to make usable fraction calculations more readable;
+    # with the weights of the trapezoidal rule each integral is a single
+    # matrix-vector product on the array values
+    def usable_fraction(e, wavelength, sr_e):
+        dx = np.diff(np.asarray(wavelength, dtype=float))
+        weights = np.zeros(len(dx) + 1)
+        weights[:-1] += dx / 2
+        weights[1:] += dx / 2
+        return (e @ (sr_e * weights)) / (e @ weights)
 
     # calculate usable fractions
-    uf_sun = integrate(e_sun * sr_sun) / integrate(e_sun)
-    uf_ref = integrate(e_ref * sr_ref) / integrate(e_ref)
+    uf_sun = usable_fraction(e_sun.to_numpy(), wl_sun, sr_sun)
+    uf_ref = usable_fraction(e_ref, wl_ref, sr_ref)
 
     # mismatch is the ratio or quotient of the usable fractions
     smm = uf_sun / uf_ref
@@ -239,6 +261,59 @@ def calc_spectral_mismatch_field(sr, e_sun, e_ref=None):
     return smm
 
 
+# coefficients of spectral_factor_firstsolar for each module_type
+_FIRST_SOLAR_COEFFICIENTS = {}
+_FIRST_SOLAR_COEFFICIENTS['cdte'] = (
+    0.86273, -0.038948, -0.012506, 0.098871, 0.084658, -0.0042948)
+_FIRST_SOLAR_COEFFICIENTS['monosi'] = (
+    0.85914, -0.020880, -0.0058853, 0.12029, 0.026814, -0.0017810)
+_FIRST_SOLAR_COEFFICIENTS['xsi'] = _FIRST_SOLAR_COEFFICIENTS['monosi']
+_FIRST_SOLAR_COEFFICIENTS['polysi'] = (
+    0.84090, -0.027539, -0.0079224, 0.13570, 0.038024, -0.0021218)
+_FIRST_SOLAR_COEFFICIENTS['multisi'] = _FIRST_SOLAR_COEFFICIENTS['polysi']
+_FIRST_SOLAR_COEFFICIENTS['cigs'] = (
+    0.85252, -0.022314, -0.0047216, 0.13666, 0.013342, -0.0008945)
+_FIRST_SOLAR_COEFFICIENTS['asi'] = (
+    1.12094, -0.047620, -0.0083627, -0.10443, 0.098382, -0.0033818)
+
+
+def _firstsolar_screen_inputs(precipitable_water, airmass_absolute,
+                              min_precipitable_water, max_precipitable_water):
+    # screen the inputs of the First Solar spectral modifier, see
+    # spectral_factor_firstsolar
+
+    # *** Pw ***
+    # Replace Pw Values below 0.1 cm with 0.1 cm to prevent model from
+    # diverging", and exceptionally high Pw values with NaN, in one pass
+    pw = np.atleast_1d(np.asarray(precipitable_water, dtype='float64'))
+    pw_low = pw < min_precipitable_water
+    pw_high = pw > max_precipitable_water
+    pw = np.where(pw_high, np.nan, np.maximum(pw, min_precipitable_water))
+    if pw_low.any():
+        warn('Exceptionally low pw values replaced with '
+             f'{min_precipitable_water} cm to prevent model divergence')
+
+    # Warn user about Pw data that is exceptionally high
+    if pw_high.any():
+        warn('Exceptionally high pw values replaced by np.nan: '
+             'check input data.')
+
+    # *** AMa ***
+    # Replace Extremely High AM with AM 10 to prevent model divergence
+    # AM > 10 will only occur very close to sunset
+    airmass_absolute = np.minimum(airmass_absolute, 10)
+
+    # Warn user about AMa data that is exceptionally low
+    if np.min(airmass_absolute) < 0.58:
+        warn('Exceptionally low air mass: ' +
+             'model not intended for extra-terrestrial use')
+        # pvl_absoluteairmass(1,pvl_alt2pres(4340)) = 0.58 Elevation of
+        # Mina Pirquita, Argentian = 4340 m. Highest elevation city with
+        # population over 50,000.
+
+    return pw, airmass_absolute
+
+
 def spectral_factor_firstsolar(precipitable_water, airmass_absolute,
                                module_type=None, coefficients=None,
                                min_precipitable_water=0.1,
@@ -346,54 +421,12 @@ def spectral_factor_firstsolar(precipitable_water, airmass_absolute,
        January 2017
     """
 
-    # --- Screen Input Data ---
-
-    # *** Pw ***
-    # Replace Pw Values below 0.1 cm with 0.1 cm to prevent model from
-    # diverging"
-    pw = np.atleast_1d(precipitable_water)
-    pw = pw.astype('float64')
-    if np.min(pw) < min_precipitable_water:
-        pw = np.maximum(pw, min_precipitable_water)
-        warn('Exceptionally low pw values replaced with '
-             f'{min_precipitable_water} cm to prevent model divergence')
-
-    # Warn user about Pw data that is exceptionally high
-    if np.max(pw) > max_precipitable_water:
-        pw[pw > max_precipitable_water] = np.nan
-        warn('Exceptionally high pw values replaced by np.nan: '
-             'check input data.')
-
-    # *** AMa ***
-    # Replace Extremely High AM with AM 10 to prevent model divergence
-    # AM > 10 will only occur very close to sunset
-    if np.max(airmass_absolute) > 10:
-        airmass_absolute = np.minimum(airmass_absolute, 10)
-
-    # Warn user about AMa data that is exceptionally low
-    if np.min(airmass_absolute) < 0.58:
-        warn('Exceptionally low air mass: ' +
-             'model not intended for extra-terrestrial use')
-        # pvl_absoluteairmass(1,pvl_alt2pres(4340)) = 0.58 Elevation of
-        # Mina Pirquita, Argentian = 4340 m. Highest elevation city with
-        # population over 50,000.
-
-    _coefficients = {}
-    _coefficients['cdte'] = (
-        0.86273, -0.038948, -0.012506, 0.098871, 0.084658, -0.0042948)
-    _coefficients['monosi'] = (
-        0.85914, -0.020880, -0.0058853, 0.12029, 0.026814, -0.0017810)
-    _coefficients['xsi'] = _coefficients['monosi']
-    _coefficients['polysi'] = (
-        0.84090, -0.027539, -0.0079224, 0.13570, 0.038024, -0.0021218)
-    _coefficients['multisi'] = _coefficients['polysi']
-    _coefficients['cigs'] = (
-        0.85252, -0.022314, -0.0047216, 0.13666, 0.013342, -0.0008945)
-    _coefficients['asi'] = (
-        1.12094, -0.047620, -0.0083627, -0.10443, 0.098382, -0.0033818)
+    pw, airmass_absolute = _firstsolar_screen_inputs(
+        precipitable_water, airmass_absolute, min_precipitable_water,
+        max_precipitable_water)
 
     if module_type is not None and coefficients is None:
-        coefficients = _coefficients[module_type.lower()]
+        coefficients = _FIRST_SOLAR_COEFFICIENTS[module_type.lower()]
     elif module_type is None and coefficients is not None:
         pass
     elif module_type is None and coefficients is None:
@@ -406,13 +439,84 @@ def spectral_factor_firstsolar(precipitable_water, airmass_absolute,
     # Evaluate Spectral Shift
     coeff = coefficients
     ama = airmass_absolute
+    sqrt_pw = np.sqrt(pw)
     modifier = (
         coeff[0] + coeff[1]*ama + coeff[2]*pw + coeff[3]*np.sqrt(ama) +
-        coeff[4]*np.sqrt(pw) + coeff[5]*ama/np.sqrt(pw))
+        coeff[4]*sqrt_pw + coeff[5]*ama/sqrt_pw)
 
     return modifier
 
 
+def spectral_factor_firstsolar_batch(precipitable_water, airmass_absolute,
+                                     module_types,
+                                     min_precipitable_water=0.1,
+                                     max_precipitable_water=8):
+    r"""
+    Spectral mismatch modifiers of several module types based on
+    precipitable water and absolute (pressure-adjusted) airmass.
+
+    Evaluates :py:func:`spectral_factor_firstsolar` for each of
+    ``module_types`` on the same inputs. The terms of the model that depend
+    only on the inputs are computed once and combined with the coefficients
+    of all module types in a single matrix product.
+
+    Parameters
+    ----------
+    precipitable_water : numeric
+        atmospheric precipitable water. [cm]
+
+    airmass_absolute : numeric
+        absolute (pressure-adjusted) airmass. [unitless]
+
+    module_types : list of str
+        cell types, see ``module_type`` of
+        :py:func:`spectral_factor_firstsolar`.
+
+    min_precipitable_water : float, default 0.1
+        minimum atmospheric precipitable water. Any ``precipitable_water``
+        value lower than ``min_precipitable_water``
+        is set to ``min_precipitable_water`` to avoid model divergence. [cm]
+
+    max_precipitable_water : float, default 8
+        maximum atmospheric precipitable water. Any ``precipitable_water``
+        value greater than ``max_precipitable_water``
+        is set to ``np.nan`` to avoid model divergence. [cm]
+
+    Returns
+    -------
+    modifiers : pandas.DataFrame
+        spectral mismatch factor (unitless) of each module type, one column
+        per element of ``module_types``. The rows correspond to the
+        flattened inputs, and the index is taken from ``airmass_absolute``
+        or ``precipitable_water`` if either is a pandas.Series.
+
+    See Also
+    --------
+    spectral_factor_firstsolar
+    """
+    pw, ama = _firstsolar_screen_inputs(
+        precipitable_water, airmass_absolute, min_precipitable_water,
+        max_precipitable_water)
+
+    pw, ama = np.broadcast_arrays(pw, np.asarray(ama, dtype='float64'))
+    pw = pw.ravel()
+    ama = ama.ravel()
+    sqrt_pw = np.sqrt(pw)
+    # terms of the model, one row each, see spectral_factor_firstsolar
+    terms = np.stack([np.ones_like(pw), ama, pw, np.sqrt(ama), sqrt_pw,
+                      ama / sqrt_pw])
+    coefficients = np.array([_FIRST_SOLAR_COEFFICIENTS[module_type.lower()]
+                             for module_type in module_types])
+
+    index = None
+    for x in (airmass_absolute, precipitable_water):
+        if isinstance(x, pd.Series):
+            index = x.index
+            break
+    return pd.DataFrame((coefficients @ terms).T, index=index,
+                        columns=module_types)
+
+
 def spectral_factor_sapm(airmass_absolute, module):
     """
     Calculates the SAPM spectral loss coefficient, F1.
@@ -437,14 +541,14 @@ def spectral_factor_sapm(airmass_absolute, module):
     nan airmass values will result in 0 output.
     """
 
-    am_coeff = [module['A4'], module['A3'], module['A2'], module['A1'],
-                module['A0']]
-
-    spectral_loss = np.polyval(am_coeff, airmass_absolute)
-
-    spectral_loss = np.where(np.isnan(spectral_loss), 0, spectral_loss)
+    # evaluate the 4th order polynomial by Horner's scheme
+    ama = np.asarray(airmass_absolute, dtype=float)
+    spectral_loss = module['A0'] + ama * (
+        module['A1'] + ama * (
+            module['A2'] + ama * (module['A3'] + ama * module['A4'])))
 
-    spectral_loss = np.maximum(0, spectral_loss)
+    # fmax replaces nan with 0 while clipping negative values
+    spectral_loss = np.fmax(spectral_loss, 0)
 
     if isinstance(airmass_absolute, pd.Series):
         spectral_loss = pd.Series(spectral_loss, airmass_absolute.index)
@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 import pvlib
 import os
+import requests
 from ..conftest import (DATA_DIR, RERUNS, RERUNS_DELAY,
                         requires_solaranywhere_credentials)
 
@@ -158,6 +159,116 @@ def timeseries_temp_air(time_series_index):
     return pd.Series(data=temp_air, index=time_series_index, name='temp_air')
 
 
+@pytest.fixture
+def weather_data_result():
+    periods = [
+        {'ObservationTime': f'2019-12-31T19:{minute:02d}:30-05:00',
+         'GlobalHorizontalIrradiance_WattsPerMeterSquared': 0,
+         'AmbientTemperature_DegreesC': 1}
+        for minute in [2, 7, 12]
+    ]
+    return {
+        'Status': 'Done',
+        'WeatherDataResults': [{
+            'Status': 'Success',
+            'WeatherDataPeriods': {'WeatherDataPeriods': periods,
+                                   'TimeResolution_Minutes': 5},
+            'WeatherSourceInformation': {'Latitude': '44.4675',
+                                         'Longitude': '-73.2075',
+                                         'Elevation_Meters': '41'},
+        }],
+    }
+
+
+def test_get_solaranywhere_mocked(requests_mock, time_series_index,
+                                  weather_data_result):
+    url = pvlib.iotools.solaranywhere.URL
+    requests_mock.post(url + '/WeatherData', json={'WeatherRequestId': 'id'})
+    requests_mock.get(url + '/WeatherDataResult/id', json=weather_data_result)
+    data, meta = pvlib.iotools.get_solaranywhere(
+        latitude=44.4675, longitude=-73.2075, api_key='empty',
+        start=pd.Timestamp(2020, 1, 1), end=pd.Timestamp(2020, 1, 2),
+        time_resolution=5)
+    pd.testing.assert_index_equal(data.index, time_series_index[:3])
+    assert 'ObservationTime' in data.columns
+    assert (data['temp_air'] == 1).all()
+    assert meta['latitude'] == 44.4675
+    assert meta['altitude'] == 41.0
+
+
+def test_get_solaranywhere_mocked_empty(requests_mock, weather_data_result):
+    url = pvlib.iotools.solaranywhere.URL
+    weather_data_result['WeatherDataResults'][0]['WeatherDataPeriods'][
+        'WeatherDataPeriods'] = []
+    requests_mock.post(url + '/WeatherData', json={'WeatherRequestId': 'id'})
+    requests_mock.get(url + '/WeatherDataResult/id', json=weather_data_result)
+    data, meta = pvlib.iotools.get_solaranywhere(
+        latitude=44.4675, longitude=-73.2075, api_key='empty',
+        start=pd.Timestamp(2020, 1, 1), end=pd.Timestamp(2020, 1, 2),
+        time_resolution=5)
+    assert data.empty
+    assert isinstance(data.index, pd.DatetimeIndex)
+    assert meta['latitude'] == 44.4675
+
+
+def test_get_solaranywhere_request_fields(requests_mock,
+                                          weather_data_result):
+    url = pvlib.iotools.solaranywhere.URL
+    post = requests_mock.post(url + '/WeatherData',
+                              json={'WeatherRequestId': 'id'})
+    requests_mock.get(url + '/WeatherDataResult/id', json=weather_data_result)
+    pvlib.iotools.get_solaranywhere(
+        latitude=44.4675, longitude=-73.2075, api_key='empty',
+        start=pd.Timestamp(2020, 1, 1), end=pd.Timestamp(2020, 1, 2),
+        request_fields=['ghi', 'temp_air'])
+    assert post.last_request.json()['Options']['OutputFields'] == [
+        'ObservationTime', 'GlobalHorizontalIrradiance_WattsPerMeterSquared',
+        'AmbientTemperature_DegreesC']
+
+
+def test_get_solaranywhere_session(requests_mock, weather_data_result,
+                                   mocker):
+    url = pvlib.iotools.solaranywhere.URL
+    requests_mock.post(url + '/WeatherData', json={'WeatherRequestId': 'id'})
+    requests_mock.get(url + '/WeatherDataResult/id', json=weather_data_result)
+    session = requests.Session()
+    post = mocker.spy(session, 'post')
+    get = mocker.spy(session, 'get')
+    pvlib.iotools.get_solaranywhere(
+        latitude=44.4675, longitude=-73.2075, api_key='empty',
+        start=pd.Timestamp(2020, 1, 1), end=pd.Timestamp(2020, 1, 2),
+        session=session)
+    assert post.call_count == 1
+    assert get.call_count == 1
+
+
+def test_get_solaranywhere_cached_session(requests_mock, weather_data_result,
+                                          tmp_path):
+    requests_cache = pytest.importorskip('requests_cache')
+    url = pvlib.iotools.solaranywhere.URL
+    requests_mock.post(url + '/WeatherData', json={'WeatherRequestId': 'id'})
+    get = requests_mock.get(url + '/WeatherDataResult/id',
+                            json=weather_data_result)
+    session = requests_cache.CachedSession(
+        str(tmp_path / 'solaranywhere_cache'), backend='sqlite',
+        allowable_methods=['GET'])
+    for _ in range(2):
+        data, _ = pvlib.iotools.get_solaranywhere(
+            latitude=44.4675, longitude=-73.2075, api_key='empty',
+            start=pd.Timestamp(2020, 1, 1), end=pd.Timestamp(2020, 1, 2),
+            session=session)
+        assert len(data) == 3
+    # the second result is read from the cache in tmp_path
+    assert get.call_count == 1
+
+
+def test_get_solaranywhere_request_fields_unknown():
+    with pytest.raises(ValueError, match="Unknown `request_fields`"):
+        pvlib.iotools.get_solaranywhere(
+            latitude=44, longitude=-73, api_key='empty',
+            request_fields=['ghi', 'poa_global'])
+
+
 @requires_solaranywhere_credentials
 @pytest.mark.remote_data
 @pytest.mark.flaky(reruns=RERUNS, reruns_delay=RERUNS_DELAY)
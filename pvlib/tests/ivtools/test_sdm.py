@@ -3,6 +3,7 @@ import pandas as pd
 
 import pytest
 from numpy.testing import assert_allclose
+from scipy.special import lambertw
 
 from pvlib.ivtools import sdm
 from pvlib import pvsystem
@@ -80,6 +81,36 @@ def test_fit_desoto():
                        rtol=1e-4)
 
 
+def test_fit_desoto_x0():
+    kwargs = dict(v_mp=31.0, i_mp=8.71, v_oc=38.3, i_sc=9.43,
+                  alpha_sc=0.005658, beta_voc=-0.13788, cells_in_series=60)
+    expected, res = sdm.fit_desoto(**kwargs)
+    # warm start from the previous solution, as dict and as array
+    result, res_dict = sdm.fit_desoto(x0=expected, **kwargs)
+    assert np.allclose(pd.Series(result), pd.Series(expected), rtol=1e-6)
+    assert res_dict.nfev < res.nfev
+    result, res_array = sdm.fit_desoto(x0=res.x, **kwargs)
+    assert np.allclose(pd.Series(result), pd.Series(expected), rtol=1e-6)
+    assert res_array.nfev == res_dict.nfev
+
+
+def test__jacobian_desoto():
+    specs = sdm._specs_desoto(9.43, 38.3, 8.71, 31.0, -0.13788, 0.005658,
+                              1.121, -0.0002677, 298.15, 8.617333262e-05)
+    params = np.array([9.45, 3.2e-10, 0.3, 125., 1.59])
+    jac = sdm._jacobian_desoto(params, specs)
+    # compare to central differences
+    expected = np.empty((5, 5))
+    for k in range(5):
+        step = np.zeros(5)
+        step[k] = params[k] * 1e-6
+        expected[:, k] = (
+            np.array(sdm._system_of_equations_desoto(params + step, specs))
+            - np.array(sdm._system_of_equations_desoto(params - step, specs))
+        ) / (2 * step[k])
+    assert_allclose(jac, expected, rtol=1e-3, atol=1e-12)
+
+
 def test_fit_desoto_failure():
     with pytest.raises(RuntimeError) as exc:
         sdm.fit_desoto(v_mp=31.0, i_mp=8.71, v_oc=38.3, i_sc=9.43,
@@ -296,6 +327,19 @@ def test_fit_pvsyst_sandia(npts=3000):
         equal_nan=True, rtol=0.63)
 
 
+def test__fit_pvsyst_sandia_gamma_singular():
+    # all curves at T0 make the regression rank deficient
+    voc = np.array([60., 61., 62., 63.])
+    isc = np.array([6., 7., 8., 9.])
+    rsh = np.full(4, 500.)
+    tck = np.full(4, 298.15)
+    vth = sdm.CONSTANTS['k'] / sdm.CONSTANTS['q'] * tck
+    gamma_ref, mu_gamma = sdm._fit_pvsyst_sandia_gamma(
+        voc, isc, rsh, vth, tck, {'cells_in_series': 96}, sdm.CONSTANTS)
+    assert np.isfinite(gamma_ref)
+    assert np.isfinite(mu_gamma)
+
+
 @pytest.mark.parametrize('vmp, imp, iph, io, rs, rsh, nnsvth, expected', [
     (2., 2., 2., 2., 2., 2., 2., np.nan),
     (2., 2., 0., 2., 2., 2., 2., np.nan),
@@ -327,25 +371,130 @@ def test__update_rsh_fixed_pt_vector():
     assert_allclose(outrsh[3], np.array([502.]), atol=.0001)
 
 
-@pytest.mark.parametrize('voc, iph, io, rs, rsh, nnsvth, expected', [
-    (2., 2., 2., 2., 2., 2., 0.5911),
-    (2., 2., 2., 0., 2., 2., 0.5911),
-    (2., 2., 0., 2., 2., 2., 0.),
-    (2., 0., 2., 2., 2., 2., 1.0161e-4),
-    (0., 2., 2., 2., 2., 2., 17.9436)])
-def test__update_io(voc, iph, io, rs, rsh, nnsvth, expected):
-    outio = sdm._update_io(voc, iph, io, rs, rsh, nnsvth)
+def test__update_rsh_fixed_pt_converged():
+    # Rsh of a single diode model whose max power point is given is
+    # already the fixed point
+    iph = np.array([5., 8.])
+    io = np.array([1e-9, 5e-10])
+    rs = np.array([0.3, 0.2])
+    rsh = np.array([300., 150.])
+    nnsvth = np.array([1.5, 1.8])
+    out = pvsystem.singlediode(iph, io, rs, rsh, nnsvth, method='newton')
+    outrsh = sdm._update_rsh_fixed_pt(out['v_mp'], out['i_mp'], iph, io, rs,
+                                      rsh, nnsvth)
+    assert_allclose(outrsh, rsh, rtol=1e-8)
+
+
+@pytest.mark.parametrize('voc, iph, rsh, nnsvth, expected', [
+    (2., 2., 2., 2., 0.5820),
+    (2., 2., 1., 2., 0.),
+    (2., 0., 2., 2., -0.5820),
+    (2., 2., 2., 1., 0.1565)])
+def test__update_io(voc, iph, rsh, nnsvth, expected):
+    outio = sdm._update_io(voc, iph, rsh, nnsvth)
     assert_allclose(outio, expected, atol=.0001)
 
 
-@pytest.mark.parametrize('voc, iph, io, rs, rsh, nnsvth', [
-    (2., 2., 2., 2., 2., 0.),
-    (-1., -1., -1., -1., -1., -1.)])
-def test__update_io_nan(voc, iph, io, rs, rsh, nnsvth):
-    outio = sdm._update_io(voc, iph, io, rs, rsh, nnsvth)
+@pytest.mark.parametrize('voc, iph, rsh, nnsvth', [
+    (2., 2., 2., np.nan),
+    (2., np.nan, 2., 2.)])
+def test__update_io_nan(voc, iph, rsh, nnsvth):
+    outio = sdm._update_io(voc, iph, rsh, nnsvth)
     assert np.isnan(outio)
 
 
+def test__update_io_vector_nan():
+    # a nan value must not affect the other values
+    outio = sdm._update_io(voc=2., iph=2., rsh=2.,
+                           nnsvth=np.array([2., np.nan]))
+    assert_allclose(outio[0], 0.5820, atol=.0001)
+    assert np.isnan(outio[1])
+
+
+def test__check_converge():
+    vmp = np.array([30., 31., 32., 33.])
+    imp = np.array([8., 8.5, 9., 9.5])
+    result = {'v_mp': vmp * np.array([1.01, .99, 1., 1.02]),
+              'i_mp': imp * np.array([.98, 1., 1.01, 1.])}
+    result['p_mp'] = result['v_mp'] * result['i_mp']
+    out = sdm._check_converge({'state': 0.0}, result, vmp, imp, 1)
+    for name, err in [('imp', (result['i_mp'] / imp - 1.) * 100.),
+                      ('vmp', (result['v_mp'] / vmp - 1.) * 100.),
+                      ('pmp', (result['p_mp'] / (imp * vmp) - 1.) * 100.)]:
+        assert_allclose(out[name + 'errmax'], np.max(err))
+        assert_allclose(out[name + 'errmin'], np.min(err))
+        assert_allclose(out[name + 'errabsmax'], np.max(np.abs(err)))
+        assert_allclose(out[name + 'errmean'], np.mean(err), atol=1e-12)
+        assert_allclose(out[name + 'errstd'], np.std(err, ddof=1))
+        assert np.isinf(out[name + 'errstdchange'])
+    out2 = sdm._check_converge(out, result, vmp, imp, 2)
+    assert out2['imperrstdchange'] == 0.
+    assert out2['state'] == 1.
+
+
+def _update_iv_params_two_filters(voc, isc, vmp, imp, ee, iph, io, rs, rsh,
+                                  nnsvth, u, maxiter, eps1):
+    # _update_iv_params as it was with the filter also updated after the rs
+    # update, for comparison
+    counter = 1.
+    prevconvergeparams = {'state': 0.0}
+    not_converged = True
+    while not_converged and counter <= maxiter:
+        rsh[u] = sdm._update_rsh_fixed_pt(vmp[u], imp[u], iph[u], io[u],
+                                          rs[u], rsh[u], nnsvth[u])
+        phi = sdm._calc_phi_exact(imp[u], iph[u], io[u], rsh[u], nnsvth[u])
+        rs[u] = (iph[u] + io[u] - imp[u]) * rsh[u] / imp[u] - \
+            nnsvth[u] * phi / imp[u] - vmp[u] / imp[u]
+        u = sdm._filter_params(ee, isc, io, rs, rsh)
+        io[u] = sdm._update_io(voc[u], iph[u], rsh[u], nnsvth[u])
+        iph = sdm._update_iph(isc, io, rs, rsh, nnsvth)
+        u = sdm._filter_params(ee, isc, io, rs, rsh)
+        i_mp, v_mp, p_mp = sdm.bishop88_mpp(iph[u], io[u], rs[u], rsh[u],
+                                            nnsvth[u])
+        result = {'i_mp': i_mp, 'v_mp': v_mp, 'p_mp': p_mp}
+        convergeparams = sdm._check_converge(
+            prevconvergeparams, result, vmp[u], imp[u], counter)
+        prevconvergeparams = convergeparams
+        counter += 1.
+        not_converged = any(
+            convergeparams[name + stat] >= eps1
+            for stat in ('errmeanchange', 'errstdchange', 'errabsmaxchange')
+            for name in ('vmp', 'imp', 'pmp'))
+    return iph, io, rs, rsh, u
+
+
+class _StopFit(Exception):
+    pass
+
+
+@requires_statsmodels
+def test__update_iv_params(monkeypatch):
+    # inputs of _update_iv_params from fitting the PVsyst demo curves
+    iv_specs, ivcurves = _read_iv_curves_for_test('PVsyst_demo.csv', 3000)
+    captured = []
+
+    def capture(*args):
+        captured.extend(args)
+        raise _StopFit
+
+    monkeypatch.setattr(sdm, '_update_iv_params', capture)
+    with pytest.raises(_StopFit):
+        sdm.fit_pvsyst_sandia(ivcurves, iv_specs)
+    monkeypatch.undo()
+
+    def copy_args():
+        return [np.copy(a) if isinstance(a, np.ndarray) else a
+                for a in captured]
+
+    iph, io, rs, rsh, u = sdm._update_iv_params(*copy_args())
+    iph2, io2, rs2, rsh2, u2 = _update_iv_params_two_filters(*copy_args())
+    np.testing.assert_array_equal(u, u2)
+    np.testing.assert_array_equal(rs, rs2)
+    np.testing.assert_array_equal(rsh, rsh2)
+    np.testing.assert_array_equal(iph, iph2)
+    np.testing.assert_array_equal(io[u], io2[u])
+
+
 @pytest.mark.parametrize('vmp, imp, iph, io, rs, rsh, nnsvth, expected', [
     (2., 2., 2., 2., 2., 2., 2., (1.8726, 2.)),
     (2., 0., 2., 2., 2., 2., 2., (1.8726, 3.4537)),
@@ -388,6 +537,31 @@ def test__calc_theta_phi_exact_vector():
     assert_allclose(phi[1], 2.2079, atol=.0001)
 
 
+@pytest.mark.parametrize('logx', [-5., 0., 1., 1.5, 10., 100., 700.])
+def test__lambertw_log(logx):
+    # W(exp(logx)) is the solution w of w + log(w) = logx
+    w = sdm._lambertw_log(logx)
+    assert_allclose(w + np.log(w), logx, rtol=1e-14, atol=1e-14)
+    if logx < 700.:
+        assert_allclose(w, lambertw(np.exp(logx)).real, rtol=1e-14)
+
+
+def test__lambertw_log_nan():
+    w = sdm._lambertw_log(np.array([np.nan, -np.inf, 800.]))
+    assert np.isnan(w[0])
+    assert np.isnan(w[1])
+    assert_allclose(w[2] + np.log(w[2]), 800., rtol=1e-14)
+
+
+def test__calc_phi_exact_overflow():
+    # argument of the Lambert W function overflows
+    imp, iph, io, rsh, nnsvth = 5.9653, 6.54, 4.06e-06, 1724.5, 1.2862
+    phi = sdm._calc_phi_exact(imp, iph, io, rsh, nnsvth)
+    logargw = np.log(rsh * io / nnsvth) + rsh * (iph + io - imp) / nnsvth
+    assert logargw > 710.
+    assert_allclose(phi + np.log(phi), logargw, rtol=1e-14)
+
+
 def test_pvsyst_temperature_coeff():
     # test for consistency with dP/dT estimated with secant rule
     params = {'alpha_sc': 0., 'gamma_ref': 1.1, 'mu_gamma': 0.,
@@ -24,6 +24,24 @@ def test__numdiff():
     assert np.allclose(iv.d2IdV2, d2f, equal_nan=True)
 
 
+def test__numdiff_2d():
+    iv = pd.read_csv(DATA_DIR / 'ivtools_numdiff.csv',
+                     names=['I', 'V', 'dIdV', 'd2IdV2'], dtype=float)
+    # second row is the first row truncated and padded with nan
+    v = np.tile(iv.V.values, (2, 1))
+    i = np.tile(iv.I.values, (2, 1))
+    v[1, -3:] = np.nan
+    i[1, -3:] = np.nan
+    df, d2f = _numdiff(v, i)
+    assert df.shape == v.shape
+    assert np.allclose(iv.dIdV, df[0], equal_nan=True)
+    assert np.allclose(iv.d2IdV2, d2f[0], equal_nan=True)
+    df1, d2f1 = _numdiff(iv.V.values[:-3], iv.I.values[:-3])
+    assert np.allclose(df1, df[1, :-3], equal_nan=True)
+    assert np.allclose(d2f1, d2f[1, :-3], equal_nan=True)
+    assert np.isnan(df[1, -3:]).all()
+
+
 def test_rectify_iv_curve(ivcurve):
     voltage, current = ivcurve
 
@@ -22,16 +22,18 @@ from .conftest import (
 # fixtures create realistic test input data
 # test input data generated at Location(32.2, -111, 'US/Arizona', 700)
 # test input data is hard coded to avoid dependencies on other parts of pvlib
+# the input data fixtures are shared by all tests in this module, so tests
+# must copy the data before modifying it
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def times():
     # must include night values
     return pd.date_range(start='20140624', freq='6h', periods=4,
                          tz='US/Arizona')
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def irrad_data(times):
     return pd.DataFrame(np.array(
         [[0.,    0.,    0.],
@@ -41,7 +43,7 @@ def irrad_data(times):
         columns=['ghi', 'dni', 'dhi'], index=times)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ephem_data(times):
     return pd.DataFrame(np.array(
         [[124.0390863, 124.0390863, -34.0390863, -34.0390863,
@@ -57,18 +59,25 @@ def ephem_data(times):
         index=times)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dni_et(times):
     return np.array(
         [1321.1655834833093, 1321.1655834833093, 1321.1655834833093,
          1321.1655834833093])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def relative_airmass(times):
     return pd.Series([np.nan, 7.58831596, 1.01688136, 3.27930443], times)
 
 
+@pytest.fixture(scope="module")
+def dni_with_nan(irrad_data):
+    dni = irrad_data['dni'].copy()
+    dni.iloc[2] = np.nan
+    return dni
+
+
 # setup for et rad test. put it here for readability
 timestamp = pd.Timestamp('20161026')
 dt_index = pd.DatetimeIndex([timestamp])
@@ -99,7 +108,7 @@ def test_get_extra_radiation(testval, expected, method):
 
 def test_get_extra_radiation_epoch_year():
     out = irradiance.get_extra_radiation(doy, method='nrel', epoch_year=2012)
-    assert_allclose(out, 1382.4926804890767, atol=0.1)
+    assert out == pytest.approx(1382.4926804890767, abs=0.1)
 
 
 @requires_numba
@@ -122,7 +131,7 @@ def test_get_extra_radiation_invalid():
 
 def test_get_ground_diffuse_simple_float():
     result = irradiance.get_ground_diffuse(40, 900)
-    assert_allclose(result, 26.32000014911496)
+    assert result == pytest.approx(26.32000014911496, rel=1e-7)
 
 
 def test_get_ground_diffuse_simple_series(irrad_data):
@@ -133,7 +142,7 @@ def test_get_ground_diffuse_simple_series(irrad_data):
 def test_get_ground_diffuse_albedo_0(irrad_data):
     ground_irrad = irradiance.get_ground_diffuse(
         40, irrad_data['ghi'], albedo=0)
-    assert (0 == ground_irrad).all()
+    assert_allclose(ground_irrad.values, 0.0)
 
 
 def test_get_ground_diffuse_albedo_series(times):
@@ -159,7 +168,7 @@ def test_get_ground_diffuse_albedo_surface(irrad_data):
 
 def test_isotropic_float():
     result = irradiance.isotropic(40, 100)
-    assert_allclose(result, 88.30222215594891)
+    assert result == pytest.approx(88.30222215594891, rel=1e-7)
 
 
 def test_isotropic_series(irrad_data):
@@ -181,7 +190,7 @@ def test_klucher_series_float():
     result = irradiance.klucher(
         surface_tilt, surface_azimuth, dhi, ghi, solar_zenith, solar_azimuth
     )
-    assert_allclose(result, expected[0])
+    assert result == pytest.approx(expected[0], rel=1e-7)
 
 
 def test_klucher_series(irrad_data, ephem_data):
@@ -261,22 +270,21 @@ def test_king(irrad_data, ephem_data):
     assert_allclose(result, [0, 44.629352, 115.182626, 79.719855], atol=1e-4)
 
 
-def test_perez(irrad_data, ephem_data, dni_et, relative_airmass):
-    dni = irrad_data['dni'].copy()
-    dni.iloc[2] = np.nan
-    out = irradiance.perez(40, 180, irrad_data['dhi'], dni,
+# perez sky diffuse for the fixture data with dni_with_nan
+PEREZ_EXPECTED = np.array([0., 31.46046871, np.nan, 45.45539877])
+
+
+def test_perez(irrad_data, ephem_data, dni_et, relative_airmass, dni_with_nan):
+    out = irradiance.perez(40, 180, irrad_data['dhi'], dni_with_nan,
                            dni_et, ephem_data['apparent_zenith'],
                            ephem_data['azimuth'], relative_airmass)
-    expected = pd.Series(np.array(
-        [0.,   31.46046871,  np.nan,   45.45539877]),
-        index=irrad_data.index)
+    expected = pd.Series(PEREZ_EXPECTED, index=irrad_data.index)
     assert_series_equal(out, expected, check_less_precise=2)
 
 
-def test_perez_driesse(irrad_data, ephem_data, dni_et, relative_airmass):
-    dni = irrad_data['dni'].copy()
-    dni.iloc[2] = np.nan
-    out = irradiance.perez_driesse(40, 180, irrad_data['dhi'], dni,
+def test_perez_driesse(irrad_data, ephem_data, dni_et, relative_airmass,
+                       dni_with_nan):
+    out = irradiance.perez_driesse(40, 180, irrad_data['dhi'], dni_with_nan,
                                    dni_et, ephem_data['apparent_zenith'],
                                    ephem_data['azimuth'], relative_airmass)
     expected = pd.Series(np.array(
@@ -285,10 +293,8 @@ def test_perez_driesse(irrad_data, ephem_data, dni_et, relative_airmass):
     assert_series_equal(out, expected, check_less_precise=2)
 
 
-def test_perez_driesse_airmass(irrad_data, ephem_data, dni_et):
-    dni = irrad_data['dni'].copy()
-    dni.iloc[2] = np.nan
-    out = irradiance.perez_driesse(40, 180, irrad_data['dhi'], dni,
+def test_perez_driesse_airmass(irrad_data, ephem_data, dni_et, dni_with_nan):
+    out = irradiance.perez_driesse(40, 180, irrad_data['dhi'], dni_with_nan,
                                    dni_et, ephem_data['apparent_zenith'],
                                    ephem_data['azimuth'], airmass=None)
     print(out)
@@ -298,10 +304,9 @@ def test_perez_driesse_airmass(irrad_data, ephem_data, dni_et):
     assert_series_equal(out, expected, check_less_precise=2)
 
 
-def test_perez_components(irrad_data, ephem_data, dni_et, relative_airmass):
-    dni = irrad_data['dni'].copy()
-    dni.iloc[2] = np.nan
-    out = irradiance.perez(40, 180, irrad_data['dhi'], dni,
+def test_perez_components(irrad_data, ephem_data, dni_et, relative_airmass,
+                          dni_with_nan):
+    out = irradiance.perez(40, 180, irrad_data['dhi'], dni_with_nan,
                            dni_et, ephem_data['apparent_zenith'],
                            ephem_data['azimuth'], relative_airmass,
                            return_components=True)
@@ -323,10 +328,8 @@ def test_perez_components(irrad_data, ephem_data, dni_et, relative_airmass):
 
 
 def test_perez_driesse_components(irrad_data, ephem_data, dni_et,
-                                  relative_airmass):
-    dni = irrad_data['dni'].copy()
-    dni.iloc[2] = np.nan
-    out = irradiance.perez_driesse(40, 180, irrad_data['dhi'], dni,
+                                  relative_airmass, dni_with_nan):
+    out = irradiance.perez_driesse(40, 180, irrad_data['dhi'], dni_with_nan,
                                    dni_et, ephem_data['apparent_zenith'],
                                    ephem_data['azimuth'], relative_airmass,
                                    return_components=True)
@@ -394,25 +397,21 @@ def test_perez_negative_horizon():
     assert_series_equal(sum_components, expected_for_sum, check_less_precise=2)
 
 
-def test_perez_arrays(irrad_data, ephem_data, dni_et, relative_airmass):
-    dni = irrad_data['dni'].copy()
-    dni.iloc[2] = np.nan
-    out = irradiance.perez(40, 180, irrad_data['dhi'].values, dni.values,
-                           dni_et, ephem_data['apparent_zenith'].values,
+def test_perez_arrays(irrad_data, ephem_data, dni_et, relative_airmass,
+                      dni_with_nan):
+    out = irradiance.perez(40, 180, irrad_data['dhi'].values,
+                           dni_with_nan.values, dni_et,
+                           ephem_data['apparent_zenith'].values,
                            ephem_data['azimuth'].values,
                            relative_airmass.values)
-    expected = np.array(
-        [0.,   31.46046871,  np.nan,   45.45539877])
-    assert_allclose(out, expected, atol=1e-2)
+    assert_allclose(out, PEREZ_EXPECTED, atol=1e-2)
     assert isinstance(out, np.ndarray)
 
 
 def test_perez_driesse_arrays(irrad_data, ephem_data, dni_et,
-                              relative_airmass):
-    dni = irrad_data['dni'].copy()
-    dni.iloc[2] = np.nan
+                              relative_airmass, dni_with_nan):
     out = irradiance.perez_driesse(40, 180, irrad_data['dhi'].values,
-                                   dni.values, dni_et,
+                                   dni_with_nan.values, dni_et,
                                    ephem_data['apparent_zenith'].values,
                                    ephem_data['azimuth'].values,
                                    relative_airmass.values)
@@ -466,17 +465,15 @@ def test_get_sky_diffuse_missing_dni_extra():
             model='haydavies')
 
 
-def test_get_sky_diffuse_missing_airmass(irrad_data, ephem_data, dni_et):
+def test_get_sky_diffuse_missing_airmass(irrad_data, ephem_data, dni_et,
+                                         dni_with_nan):
     # test assumes location is Tucson, AZ
     # calculated airmass should be the equivalent to fixture airmass
-    dni = irrad_data['dni'].copy()
-    dni.iloc[2] = np.nan
     out = irradiance.get_sky_diffuse(
-        40, 180, ephem_data['apparent_zenith'], ephem_data['azimuth'], dni,
-        irrad_data['ghi'], irrad_data['dhi'], dni_et,  model='perez')
-    expected = pd.Series(np.array(
-        [0., 31.46046871, np.nan, 45.45539877]),
-        index=irrad_data.index)
+        40, 180, ephem_data['apparent_zenith'], ephem_data['azimuth'],
+        dni_with_nan, irrad_data['ghi'], irrad_data['dhi'], dni_et,
+        model='perez')
+    expected = pd.Series(PEREZ_EXPECTED, index=irrad_data.index)
     assert_series_equal(out, expected, check_less_precise=2)
 
 
@@ -491,24 +488,23 @@ def test_campbell_norman():
     assert_frame_equal(out, expected)
 
 
+@pytest.mark.parametrize('model', ['isotropic', 'klucher',
+                                   'haydavies', 'reindl', 'king',
+                                   'perez', 'perez-driesse'])
 def test_get_total_irradiance(irrad_data, ephem_data, dni_et,
-                              relative_airmass):
-    models = ['isotropic', 'klucher',
-              'haydavies', 'reindl', 'king', 'perez', 'perez-driesse']
-
-    for model in models:
-        total = irradiance.get_total_irradiance(
-            32, 180,
-            ephem_data['apparent_zenith'], ephem_data['azimuth'],
-            dni=irrad_data['dni'], ghi=irrad_data['ghi'],
-            dhi=irrad_data['dhi'],
-            dni_extra=dni_et, airmass=relative_airmass,
-            model=model,
-            surface_type='urban')
+                              relative_airmass, model):
+    total = irradiance.get_total_irradiance(
+        32, 180,
+        ephem_data['apparent_zenith'], ephem_data['azimuth'],
+        dni=irrad_data['dni'], ghi=irrad_data['ghi'],
+        dhi=irrad_data['dhi'],
+        dni_extra=dni_et, airmass=relative_airmass,
+        model=model,
+        surface_type='urban')
 
-        assert total.columns.tolist() == ['poa_global', 'poa_direct',
-                                          'poa_diffuse', 'poa_sky_diffuse',
-                                          'poa_ground_diffuse']
+    assert total.columns.tolist() == ['poa_global', 'poa_direct',
+                                      'poa_diffuse', 'poa_sky_diffuse',
+                                      'poa_ground_diffuse']
 
 
 @pytest.mark.parametrize('model', ['isotropic', 'klucher',
@@ -700,14 +696,29 @@ def test_disc_min_cos_zenith_max_zenith():
     assert_frame_equal(out, expected)
 
 
-def test_dirint_value():
-    times = pd.DatetimeIndex(['2014-06-24T12-0700', '2014-06-24T18-0700'])
+DIRINT_TIMES = pd.DatetimeIndex(['2014-06-24T12-0700', '2014-06-24T18-0700'])
+
+
+@pytest.fixture(scope="module")
+def dirint_inputs():
+    # inputs shared by the DIRINT tests of the model options
+    times = DIRINT_TIMES
     ghi = pd.Series([1038.62, 254.53], index=times)
     zenith = pd.Series([10.567, 72.469], index=times)
+    return times, ghi, zenith
+
+
+@pytest.mark.parametrize('kwargs,expected', [
+    ({}, [868.8, 699.7]),
+    ({'temp_dew': 10}, [882.1, 672.6]),
+    ({'use_delta_kt_prime': False}, [861.9, 670.4]),
+])
+def test_dirint_value(dirint_inputs, kwargs, expected):
+    times, ghi, zenith = dirint_inputs
     pressure = 93193.
-    dirint_data = irradiance.dirint(ghi, zenith, times, pressure=pressure)
-    assert_almost_equal(dirint_data.values,
-                        np.array([868.8,  699.7]), 1)
+    dirint_data = irradiance.dirint(ghi, zenith, times, pressure=pressure,
+                                    **kwargs)
+    assert_almost_equal(dirint_data.values, np.array(expected), 1)
 
 
 def test_dirint_nans():
@@ -722,40 +733,21 @@ def test_dirint_nans():
                         np.array([np.nan, np.nan, np.nan, np.nan, 893.1]), 1)
 
 
-def test_dirint_tdew():
-    times = pd.DatetimeIndex(['2014-06-24T12-0700', '2014-06-24T18-0700'])
-    ghi = pd.Series([1038.62, 254.53], index=times)
-    zenith = pd.Series([10.567, 72.469], index=times)
-    pressure = 93193.
-    dirint_data = irradiance.dirint(ghi, zenith, times, pressure=pressure,
-                                    temp_dew=10)
-    assert_almost_equal(dirint_data.values,
-                        np.array([882.1,  672.6]), 1)
-
-
-def test_dirint_no_delta_kt():
-    times = pd.DatetimeIndex(['2014-06-24T12-0700', '2014-06-24T18-0700'])
-    ghi = pd.Series([1038.62, 254.53], index=times)
-    zenith = pd.Series([10.567, 72.469], index=times)
-    pressure = 93193.
-    dirint_data = irradiance.dirint(ghi, zenith, times, pressure=pressure,
-                                    use_delta_kt_prime=False)
-    assert_almost_equal(dirint_data.values,
-                        np.array([861.9,  670.4]), 1)
-
-
 def test_dirint_coeffs():
     coeffs = irradiance._get_dirint_coeffs()
     assert coeffs[0, 0, 0, 0] == 0.385230
     assert coeffs[0, 1, 2, 1] == 0.229970
     assert coeffs[3, 2, 6, 3] == 1.032260
+    # the cached table is shared by all calls and must not be modified
+    assert irradiance._get_dirint_coeffs() is coeffs
+    assert not coeffs.flags.writeable
 
 
 def test_dirint_min_cos_zenith_max_zenith():
     # map out behavior under difficult conditions with various
     # limiting kwargs settings
     # times don't have any physical relevance
-    times = pd.DatetimeIndex(['2014-06-24T12-0700', '2014-06-24T18-0700'])
+    times = DIRINT_TIMES
     ghi = pd.Series([0, 1], index=times)
     solar_zenith = pd.Series([90, 89.99], index=times)
 
@@ -926,33 +918,31 @@ def test_gti_dirint():
     assert_frame_equal(output, expected)
 
 
+ERBS_INDEX = pd.DatetimeIndex(['20190101']*3 + ['20190620'])
+ERBS_EXPECTED = pd.DataFrame(np.array(
+    [[0.00000000e+00, 0.00000000e+00, 0.00000000e+00],
+     [9.67192672e+01, 4.15703604e+01, 4.05723511e-01],
+     [7.94205651e+02, 2.17860117e+02, 7.18132729e-01],
+     [8.42001578e+02, 1.70790318e+02, 7.68214312e-01]]),
+    columns=['dni', 'dhi', 'kt'], index=ERBS_INDEX)
+
+
 def test_erbs():
-    index = pd.DatetimeIndex(['20190101']*3 + ['20190620'])
+    index = ERBS_INDEX
     ghi = pd.Series([0, 50, 1000, 1000], index=index)
     zenith = pd.Series([120, 85, 10, 10], index=index)
-    expected = pd.DataFrame(np.array(
-        [[0.00000000e+00, 0.00000000e+00, 0.00000000e+00],
-         [9.67192672e+01, 4.15703604e+01, 4.05723511e-01],
-         [7.94205651e+02, 2.17860117e+02, 7.18132729e-01],
-         [8.42001578e+02, 1.70790318e+02, 7.68214312e-01]]),
-        columns=['dni', 'dhi', 'kt'], index=index)
 
     out = irradiance.erbs(ghi, zenith, index)
 
-    assert_frame_equal(np.round(out, 0), np.round(expected, 0))
+    assert_frame_equal(out, ERBS_EXPECTED)
 
 
 def test_erbs_driesse():
-    index = pd.DatetimeIndex(['20190101']*3 + ['20190620'])
+    index = ERBS_INDEX
     ghi = pd.Series([0, 50, 1000, 1000], index=index)
     zenith = pd.Series([120, 85, 10, 10], index=index)
     # expected values are the same as for erbs original test
-    expected = pd.DataFrame(np.array(
-        [[0.00000000e+00, 0.00000000e+00, 0.00000000e+00],
-         [9.67192672e+01, 4.15703604e+01, 4.05723511e-01],
-         [7.94205651e+02, 2.17860117e+02, 7.18132729e-01],
-         [8.42001578e+02, 1.70790318e+02, 7.68214312e-01]]),
-        columns=['dni', 'dhi', 'kt'], index=index)
+    expected = ERBS_EXPECTED
 
     out = irradiance.erbs_driesse(ghi, zenith, index)
 
@@ -1053,7 +1043,7 @@ def test_erbs_all_scalar():
     out = irradiance.erbs(ghi, zenith, doy)
 
     for k, v in out.items():
-        assert_allclose(v, expected[k], 5)
+        assert v == pytest.approx(expected[k], rel=1e-3)
 
 
 def test_dirindex(times):
@@ -1097,7 +1087,7 @@ def test_dirindex_min_cos_zenith_max_zenith():
     # map out behavior under difficult conditions with various
     # limiting kwargs settings
     # times don't have any physical relevance
-    times = pd.DatetimeIndex(['2014-06-24T12-0700', '2014-06-24T18-0700'])
+    times = DIRINT_TIMES
     ghi = pd.Series([0, 1], index=times)
     ghi_clearsky = pd.Series([0, 1], index=times)
     dni_clearsky = pd.Series([0, 5], index=times)
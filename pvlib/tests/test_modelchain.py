@@ -89,7 +89,7 @@ def cec_dc_native_snl_ac_system(cec_module_cs5p_220m, cec_inverter_parameters,
 def pvsyst_dc_snl_ac_system(pvsyst_module_params, cec_inverter_parameters,
                             sapm_temperature_cs5p_220m):
     module = 'PVsyst test module'
-    module_parameters = pvsyst_module_params
+    module_parameters = pvsyst_module_params.copy()
     module_parameters['b'] = 0.05
     temp_model_params = sapm_temperature_cs5p_220m.copy()
     system = PVSystem(surface_tilt=32.2, surface_azimuth=180,
@@ -104,7 +104,7 @@ def pvsyst_dc_snl_ac_system(pvsyst_module_params, cec_inverter_parameters,
 def pvsyst_dc_snl_ac_arrays(pvsyst_module_params, cec_inverter_parameters,
                             sapm_temperature_cs5p_220m):
     module = 'PVsyst test module'
-    module_parameters = pvsyst_module_params
+    module_parameters = pvsyst_module_params.copy()
     module_parameters['b'] = 0.05
     temp_model_params = sapm_temperature_cs5p_220m.copy()
     array_one = pvsystem.Array(
@@ -261,19 +261,30 @@ def system_no_temp(cec_module_cs5p_220m, cec_inverter_parameters):
     return system
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def location():
+    # no test modifies the location, so it is shared by the module
     return Location(32.2, -111, altitude=700)
 
 
+@pytest.fixture(scope='module')
+def times():
+    # DatetimeIndex is immutable, so the index is shared by the module
+    return pd.date_range('20160101 1200-0700', periods=2, freq='6h')
+
+
 @pytest.fixture
-def weather():
-    times = pd.date_range('20160101 1200-0700', periods=2, freq='6h')
+def weather(times):
     weather = pd.DataFrame({'ghi': [500, 0], 'dni': [800, 0], 'dhi': [100, 0]},
                            index=times)
     return weather
 
 
+@pytest.fixture
+def irradiance_900(times):
+    return pd.DataFrame({'dni': 900, 'ghi': 600, 'dhi': 150}, index=times)
+
+
 @pytest.fixture
 def total_irrad(weather):
     return pd.DataFrame({'poa_global': [800., 500.],
@@ -348,15 +359,20 @@ def test_with_pvwatts(pvwatts_dc_pvwatts_ac_system, location, weather):
     mc.run_model(weather)
 
 
-def test_run_model_with_irradiance(sapm_dc_snl_ac_system, location):
-    mc = ModelChain(sapm_dc_snl_ac_system, location)
-    times = pd.date_range('20160101 1200-0700', periods=2, freq='6h')
-    irradiance = pd.DataFrame({'dni': 900, 'ghi': 600, 'dhi': 150},
-                              index=times)
+@pytest.mark.parametrize('mc_kwargs,expected', [
+    ({}, [187.80746494643176, -0.02]),
+    ({'transposition_model': 'perez'}, [187.94295642, -2.00000000e-02]),
+    ({'airmass_model': 'gueymard1993', 'transposition_model': 'perez'},
+     [187.94317405, -2.00000000e-02]),
+], ids=['default', 'perez', 'gueymard_perez'])
+def test_run_model_with_irradiance(sapm_dc_snl_ac_system, location,
+                                   irradiance_900, mc_kwargs, expected):
+    mc = ModelChain(sapm_dc_snl_ac_system, location, **mc_kwargs)
+    irradiance = irradiance_900
+    times = irradiance.index
     ac = mc.run_model(irradiance).results.ac
 
-    expected = pd.Series(np.array([187.80746494643176, -0.02]),
-                         index=times)
+    expected = pd.Series(np.array(expected), index=times)
     assert_series_equal(ac, expected)
 
 
@@ -395,7 +411,7 @@ def multi_array_sapm_dc_snl_ac_system(
 
 
 def test_run_model_from_irradiance_arrays_no_loss(
-        multi_array_sapm_dc_snl_ac_system, location):
+        multi_array_sapm_dc_snl_ac_system, location, irradiance_900):
     mc_both = ModelChain(
         multi_array_sapm_dc_snl_ac_system['two_array_system'],
         location,
@@ -417,9 +433,7 @@ def test_run_model_from_irradiance_arrays_no_loss(
         spectral_model='no_loss',
         losses_model='no_loss'
     )
-    times = pd.date_range('20160101 1200-0700', periods=2, freq='6h')
-    irradiance = pd.DataFrame({'dni': 900, 'ghi': 600, 'dhi': 150},
-                              index=times)
+    irradiance = irradiance_900
     mc_one.run_model(irradiance)
     mc_two.run_model(irradiance)
     mc_both.run_model(irradiance)
@@ -435,7 +449,8 @@ def test_run_model_from_irradiance_arrays_no_loss(
 
 @pytest.mark.parametrize("input_type", [tuple, list])
 def test_run_model_from_irradiance_arrays_no_loss_input_type(
-        multi_array_sapm_dc_snl_ac_system, location, input_type):
+        multi_array_sapm_dc_snl_ac_system, location, input_type,
+        irradiance_900):
     mc_both = ModelChain(
         multi_array_sapm_dc_snl_ac_system['two_array_system'],
         location,
@@ -457,9 +472,7 @@ def test_run_model_from_irradiance_arrays_no_loss_input_type(
         spectral_model='no_loss',
         losses_model='no_loss'
     )
-    times = pd.date_range('20160101 1200-0700', periods=2, freq='6h')
-    irradiance = pd.DataFrame({'dni': 900, 'ghi': 600, 'dhi': 150},
-                              index=times)
+    irradiance = irradiance_900
     mc_one.run_model(irradiance)
     mc_two.run_model(irradiance)
     mc_both.run_model(input_type((irradiance, irradiance)))
@@ -485,9 +498,7 @@ def test_ModelChain_invalid_inverter_params_arrays(
 
 @pytest.mark.parametrize("input_type", [tuple, list])
 def test_prepare_inputs_multi_weather(
-        sapm_dc_snl_ac_system_Array, location, input_type):
-    times = pd.date_range(start='20160101 1200-0700',
-                          end='20160101 1800-0700', freq='6h')
+        sapm_dc_snl_ac_system_Array, location, input_type, times):
     mc = ModelChain(sapm_dc_snl_ac_system_Array, location)
     weather = pd.DataFrame({'ghi': 1, 'dhi': 1, 'dni': 1},
                            index=times)
@@ -500,9 +511,7 @@ def test_prepare_inputs_multi_weather(
 
 @pytest.mark.parametrize("input_type", [tuple, list])
 def test_prepare_inputs_albedo_in_weather(
-        sapm_dc_snl_ac_system_Array, location, input_type):
-    times = pd.date_range(start='20160101 1200-0700',
-                          end='20160101 1800-0700', freq='6h')
+        sapm_dc_snl_ac_system_Array, location, input_type, times):
     mc = ModelChain(sapm_dc_snl_ac_system_Array, location)
     weather = pd.DataFrame({'ghi': 1, 'dhi': 1, 'dni': 1, 'albedo': 0.5},
                            index=times)
@@ -631,33 +640,6 @@ def test_run_model_arrays_weather(sapm_dc_snl_ac_system_same_arrays,
     assert not mc.results.ac.empty
 
 
-def test_run_model_perez(sapm_dc_snl_ac_system, location):
-    mc = ModelChain(sapm_dc_snl_ac_system, location,
-                    transposition_model='perez')
-    times = pd.date_range('20160101 1200-0700', periods=2, freq='6h')
-    irradiance = pd.DataFrame({'dni': 900, 'ghi': 600, 'dhi': 150},
-                              index=times)
-    ac = mc.run_model(irradiance).results.ac
-
-    expected = pd.Series(np.array([187.94295642, -2.00000000e-02]),
-                         index=times)
-    assert_series_equal(ac, expected)
-
-
-def test_run_model_gueymard_perez(sapm_dc_snl_ac_system, location):
-    mc = ModelChain(sapm_dc_snl_ac_system, location,
-                    airmass_model='gueymard1993',
-                    transposition_model='perez')
-    times = pd.date_range('20160101 1200-0700', periods=2, freq='6h')
-    irradiance = pd.DataFrame({'dni': 900, 'ghi': 600, 'dhi': 150},
-                              index=times)
-    ac = mc.run_model(irradiance).results.ac
-
-    expected = pd.Series(np.array([187.94317405, -2.00000000e-02]),
-                         index=times)
-    assert_series_equal(ac, expected)
-
-
 def test_run_model_with_weather_sapm_temp(sapm_dc_snl_ac_system, location,
                                           weather, mocker):
     # test with sapm cell temperature model
@@ -1180,15 +1162,14 @@ def poadc(mc):
 
 @pytest.mark.parametrize('dc_model', [
     'sapm', 'cec', 'desoto', 'pvsyst', 'singlediode', 'pvwatts_dc'])
-def test_infer_dc_model(sapm_dc_snl_ac_system, cec_dc_snl_ac_system,
-                        pvsyst_dc_snl_ac_system, pvwatts_dc_pvwatts_ac_system,
-                        location, dc_model, weather, mocker):
-    dc_systems = {'sapm': sapm_dc_snl_ac_system,
-                  'cec': cec_dc_snl_ac_system,
-                  'desoto': cec_dc_snl_ac_system,
-                  'pvsyst': pvsyst_dc_snl_ac_system,
-                  'singlediode': cec_dc_snl_ac_system,
-                  'pvwatts_dc': pvwatts_dc_pvwatts_ac_system}
+def test_infer_dc_model(location, dc_model, weather, mocker, request):
+    # only the system fixture for this dc_model is built
+    dc_systems = {'sapm': 'sapm_dc_snl_ac_system',
+                  'cec': 'cec_dc_snl_ac_system',
+                  'desoto': 'cec_dc_snl_ac_system',
+                  'pvsyst': 'pvsyst_dc_snl_ac_system',
+                  'singlediode': 'cec_dc_snl_ac_system',
+                  'pvwatts_dc': 'pvwatts_dc_pvwatts_ac_system'}
     dc_model_function = {'sapm': 'sapm',
                          'cec': 'calcparams_cec',
                          'desoto': 'calcparams_desoto',
@@ -1203,7 +1184,7 @@ def test_infer_dc_model(sapm_dc_snl_ac_system, cec_dc_snl_ac_system,
                            'pvwatts_dc': 'sapm'}
     temp_model_params = {'sapm': {'a': -3.40641, 'b': -0.0842075, 'deltaT': 3},
                          'pvsyst': {'u_c': 29.0, 'u_v': 0}}
-    system = dc_systems[dc_model]
+    system = request.getfixturevalue(dc_systems[dc_model])
     for array in system.arrays:
         array.temperature_model_parameters = temp_model_params[
             temp_model_function[dc_model]]
@@ -1260,13 +1241,11 @@ def test_singlediode_dc_arrays(location, dc_model,
 
 
 @pytest.mark.parametrize('dc_model', ['sapm', 'cec', 'cec_native'])
-def test_infer_spectral_model(location, sapm_dc_snl_ac_system,
-                              cec_dc_snl_ac_system,
-                              cec_dc_native_snl_ac_system, dc_model):
-    dc_systems = {'sapm': sapm_dc_snl_ac_system,
-                  'cec': cec_dc_snl_ac_system,
-                  'cec_native': cec_dc_native_snl_ac_system}
-    system = dc_systems[dc_model]
+def test_infer_spectral_model(location, dc_model, request):
+    dc_systems = {'sapm': 'sapm_dc_snl_ac_system',
+                  'cec': 'cec_dc_snl_ac_system',
+                  'cec_native': 'cec_dc_native_snl_ac_system'}
+    system = request.getfixturevalue(dc_systems[dc_model])
     mc = ModelChain(system, location, aoi_model='physical')
     assert isinstance(mc, ModelChain)
 
@@ -1274,18 +1253,14 @@ def test_infer_spectral_model(location, sapm_dc_snl_ac_system,
 @pytest.mark.parametrize('temp_model', [
     'sapm_temp', 'faiman_temp', 'pvsyst_temp', 'fuentes_temp',
     'noct_sam_temp'])
-def test_infer_temp_model(location, sapm_dc_snl_ac_system,
-                          pvwatts_dc_pvwatts_ac_pvsyst_temp_system,
-                          pvwatts_dc_pvwatts_ac_faiman_temp_system,
-                          pvwatts_dc_pvwatts_ac_fuentes_temp_system,
-                          pvwatts_dc_pvwatts_ac_noct_sam_temp_system,
-                          temp_model):
-    dc_systems = {'sapm_temp': sapm_dc_snl_ac_system,
-                  'pvsyst_temp': pvwatts_dc_pvwatts_ac_pvsyst_temp_system,
-                  'faiman_temp': pvwatts_dc_pvwatts_ac_faiman_temp_system,
-                  'fuentes_temp': pvwatts_dc_pvwatts_ac_fuentes_temp_system,
-                  'noct_sam_temp': pvwatts_dc_pvwatts_ac_noct_sam_temp_system}
-    system = dc_systems[temp_model]
+def test_infer_temp_model(location, temp_model, request):
+    dc_systems = {
+        'sapm_temp': 'sapm_dc_snl_ac_system',
+        'pvsyst_temp': 'pvwatts_dc_pvwatts_ac_pvsyst_temp_system',
+        'faiman_temp': 'pvwatts_dc_pvwatts_ac_faiman_temp_system',
+        'fuentes_temp': 'pvwatts_dc_pvwatts_ac_fuentes_temp_system',
+        'noct_sam_temp': 'pvwatts_dc_pvwatts_ac_noct_sam_temp_system'}
+    system = request.getfixturevalue(dc_systems[temp_model])
     mc = ModelChain(system, location, aoi_model='physical',
                     spectral_model='no_loss')
     assert temp_model == mc.temperature_model.__name__
@@ -1356,15 +1331,12 @@ def acdc(mc):
 @pytest.mark.parametrize('inverter_model', ['sandia', 'adr',
                                             'pvwatts', 'sandia_multi',
                                             'pvwatts_multi'])
-def test_ac_models(sapm_dc_snl_ac_system, cec_dc_adr_ac_system,
-                   pvwatts_dc_pvwatts_ac_system, cec_dc_snl_ac_arrays,
-                   pvwatts_dc_pvwatts_ac_system_arrays,
-                   location, inverter_model, weather, mocker):
-    ac_systems = {'sandia': sapm_dc_snl_ac_system,
-                  'sandia_multi': cec_dc_snl_ac_arrays,
-                  'adr': cec_dc_adr_ac_system,
-                  'pvwatts': pvwatts_dc_pvwatts_ac_system,
-                  'pvwatts_multi': pvwatts_dc_pvwatts_ac_system_arrays}
+def test_ac_models(location, inverter_model, weather, mocker, request):
+    ac_systems = {'sandia': 'sapm_dc_snl_ac_system',
+                  'sandia_multi': 'cec_dc_snl_ac_arrays',
+                  'adr': 'cec_dc_adr_ac_system',
+                  'pvwatts': 'pvwatts_dc_pvwatts_ac_system',
+                  'pvwatts_multi': 'pvwatts_dc_pvwatts_ac_system_arrays'}
     inverter_to_ac_model = {
         'sandia': 'sandia',
         'sandia_multi': 'sandia',
@@ -1372,7 +1344,7 @@ def test_ac_models(sapm_dc_snl_ac_system, cec_dc_adr_ac_system,
         'pvwatts': 'pvwatts',
         'pvwatts_multi': 'pvwatts'}
     ac_model = inverter_to_ac_model[inverter_model]
-    system = ac_systems[inverter_model]
+    system = request.getfixturevalue(ac_systems[inverter_model])
 
     mc_inferred = ModelChain(system, location,
                              aoi_model='no_loss', spectral_model='no_loss')
@@ -1787,35 +1759,15 @@ def test_ModelChain_no_extra_kwargs(sapm_dc_snl_ac_system, location):
         ModelChain(sapm_dc_snl_ac_system, location, arbitrary_kwarg='value')
 
 
-def test_basic_chain_alt_az(sam_data, cec_inverter_parameters,
-                            sapm_temperature_cs5p_220m):
-    times = pd.date_range(start='20160101 1200-0700',
-                          end='20160101 1800-0700', freq='6h')
-    latitude = 32.2
-    longitude = -111
-    surface_tilt = 0
-    surface_azimuth = 0
-    modules = sam_data['sandiamod']
-    module_parameters = modules['Canadian_Solar_CS5P_220M___2009_']
-    temp_model_params = sapm_temperature_cs5p_220m.copy()
-    with pytest.warns(pvlibDeprecationWarning, match='with_pvwatts'):
-        dc, ac = modelchain.basic_chain(times, latitude, longitude,
-                                        surface_tilt, surface_azimuth,
-                                        module_parameters, temp_model_params,
-                                        cec_inverter_parameters)
-
-    expected = pd.Series(np.array([111.621405, -2.00000000e-02]),
-                         index=times)
-    assert_series_equal(ac, expected)
-
-
-def test_basic_chain_altitude_pressure(sam_data, cec_inverter_parameters,
-                                       sapm_temperature_cs5p_220m):
-    times = pd.date_range(start='20160101 1200-0700',
-                          end='20160101 1800-0700', freq='6h')
+@pytest.mark.parametrize('kwargs,expected', [
+    ({}, 111.621405),
+    ({'pressure': 93194}, 113.190045),
+    ({'altitude': 700}, 113.189814),
+])
+def test_basic_chain(sam_data, cec_inverter_parameters,
+                     sapm_temperature_cs5p_220m, times, kwargs, expected):
     latitude = 32.2
     longitude = -111
-    altitude = 700
     surface_tilt = 0
     surface_azimuth = 0
     modules = sam_data['sandiamod']
@@ -1825,21 +1777,9 @@ def test_basic_chain_altitude_pressure(sam_data, cec_inverter_parameters,
         dc, ac = modelchain.basic_chain(times, latitude, longitude,
                                         surface_tilt, surface_azimuth,
                                         module_parameters, temp_model_params,
-                                        cec_inverter_parameters,
-                                        pressure=93194)
-
-    expected = pd.Series(np.array([113.190045, -2.00000000e-02]),
-                         index=times)
-    assert_series_equal(ac, expected)
-
-    with pytest.warns(pvlibDeprecationWarning, match='with_pvwatts'):
-        dc, ac = modelchain.basic_chain(times, latitude, longitude,
-                                        surface_tilt, surface_azimuth,
-                                        module_parameters, temp_model_params,
-                                        cec_inverter_parameters,
-                                        altitude=altitude)
+                                        cec_inverter_parameters, **kwargs)
 
-    expected = pd.Series(np.array([113.189814, -2.00000000e-02]),
+    expected = pd.Series(np.array([expected, -2.00000000e-02]),
                          index=times)
     assert_series_equal(ac, expected)
 
@@ -138,6 +138,16 @@ def test_get_am15g():
     assert_allclose(e, expected, rtol=1e-6)
 
 
+def test_get_am15g_copy():
+    # modifying the returned spectrum must not affect later calls
+    e = spectrum.get_am15g()
+    e[:] = 0.
+    e.name = 'changed'
+    e = spectrum.get_am15g()
+    assert e.name == 'am15g'
+    assert_approx_equal(np.sum(e), 1002.88, significant=6)
+
+
 def test_calc_spectral_mismatch_field(spectrl2_data):
     # test that the mismatch is calculated correctly with
     # - default and custom reference sepctrum
@@ -258,6 +268,41 @@ def test_spectral_factor_firstsolar_range():
                                                   module_type='monosi')
 
 
+def test_spectral_factor_firstsolar_nan():
+    # NaN values must not prevent the limits on the other values
+    pw = np.array([0.05, np.nan, 2.])
+    airmass = np.array([1.5, np.nan, 15.])
+    with pytest.warns(UserWarning, match='Exceptionally low pw values'):
+        out = spectrum.spectral_factor_firstsolar(pw, airmass, 'monosi')
+    expected = spectrum.spectral_factor_firstsolar(
+        np.array([0.1, np.nan, 2.]), np.array([1.5, np.nan, 10.]), 'monosi')
+    assert_allclose(out, expected)
+    assert_allclose(out, [0.97458734, np.nan, 1.04428693])
+
+
+def test_spectral_factor_firstsolar_batch():
+    module_types = ['cdte', 'monosi', 'polysi', 'cigs', 'asi']
+    pws = np.array([0.05, 1, 3, 5, 10])
+    ams = np.array([1, 3, 5, 12, 2])
+    with pytest.warns(UserWarning, match='Exceptionally'):
+        out = spectrum.spectral_factor_firstsolar_batch(pws, ams,
+                                                        module_types)
+    assert list(out.columns) == module_types
+    for module_type in module_types:
+        with pytest.warns(UserWarning, match='Exceptionally'):
+            expected = spectrum.spectral_factor_firstsolar(pws, ams,
+                                                           module_type)
+        assert_allclose(out[module_type], expected)
+
+
+def test_spectral_factor_firstsolar_batch_series():
+    index = pd.date_range('2024-06-01 12:00', freq='1h', periods=3)
+    ams = pd.Series([1, 2, 3], index=index)
+    out = spectrum.spectral_factor_firstsolar_batch(1.5, ams, ['CdTe'])
+    expected = spectrum.spectral_factor_firstsolar(1.5, ams, 'cdte')
+    assert_series_equal(out['CdTe'], expected, check_names=False)
+
+
 @pytest.mark.parametrize('airmass,expected', [
     (1.5, 1.00028714375),
     (np.array([[10, np.nan]]), np.array([[0.999535, 0]])),